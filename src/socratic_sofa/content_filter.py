@@ -3,9 +3,20 @@ Content moderation for Socratic Sofa
 Uses AI to evaluate if topics are appropriate for philosophical dialogue
 """
 
+import hashlib
+import json
 import os
-
-from anthropic import Anthropic
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from functools import cache
+from importlib import resources
+from types import MappingProxyType
+from typing import Any
+
+from anthropic import Anthropic, AnthropicError
 
 from socratic_sofa.logging_config import get_logger
 from socratic_sofa.rate_limiter import rate_limited
@@ -13,36 +24,164 @@ from socratic_sofa.rate_limiter import rate_limited
 # Module logger
 logger = get_logger(__name__)
 
+_MAX_TOPIC_LEN = 500
+
+# Short, canonical philosophical questions that never need an API round-trip.
+# Anchored so that a safe keyword embedded in a longer topic still gets moderated.
+_FAST_ALLOW = re.compile(
+    r"\s*(?:what\s+is|what\s+are|is\s+there|do\s+we\s+have|does)?\s*"
+    r"(?:justice|virtue|consciousness|free\s+will|morality|epistemology|aesthetics)"
+    r"(?:\s+(?:exist|real|objective))?\s*\??\s*",
+    re.IGNORECASE,
+)
+
+# Moderation decisions keyed by normalized-topic digest: key -> (stored_at, result),
+# least recently used first
+_moderation_cache: OrderedDict[str, tuple[float, tuple[bool, str]]] = OrderedDict()
+_cache_lock = threading.Lock()  # Gradio handlers moderate from several worker threads
+_TTL = 3600  # seconds
+_CACHE_MAXSIZE = 512  # entries; the least recently used decision is evicted beyond this
+
+# Circuit breaker: after repeated API failures, fail open without calling the API
+_BREAKER_THRESHOLD = 5  # consecutive failures before opening
+_BREAKER_COOLDOWN = 30  # seconds to stay open
+_breaker: dict[str, float] = {"fails": 0, "open_until": 0.0}
+_breaker_lock = threading.Lock()  # failures are counted from concurrent handlers too
+
+
+def _cache_key(topic: str) -> str:
+    """Return a fixed-size cache key for a topic (case- and surrounding-whitespace-insensitive)."""
+    return hashlib.blake2b(topic.strip().lower().encode(), digest_size=16).hexdigest()
+
+
+def _get_cached(topic: str) -> tuple[bool, str] | None:
+    """Return a cached moderation decision if present and not expired."""
+    key = _cache_key(topic)
+    with _cache_lock:
+        entry = _moderation_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at >= _TTL:
+            _moderation_cache.pop(key, None)
+            return None
+        _moderation_cache.move_to_end(key)
+        return result
+
+
+def _store_cached(topic: str, result: tuple[bool, str]) -> None:
+    """Remember a definitive moderation decision, evicting the least recently used."""
+    key = _cache_key(topic)
+    with _cache_lock:
+        _moderation_cache[key] = (time.monotonic(), result)
+        _moderation_cache.move_to_end(key)
+        if len(_moderation_cache) > _CACHE_MAXSIZE:
+            _moderation_cache.popitem(last=False)
+
+
+def _decide_locally(topic: str) -> tuple[bool, str] | None:
+    """
+    Decide a topic without calling the moderation API, if possible.
+
+    Covers empty and oversized input, the fast allow pattern, cached
+    decisions and the open circuit breaker.
 
-@rate_limited(calls=10, period=60)
-def is_topic_appropriate(topic: str) -> tuple[bool, str]:
+    Args:
+        topic: The topic string to check
+
+    Returns:
+        (is_appropriate, reason) if decided locally, otherwise None
+    """
+    if not topic:
+        return True, ""
+
+    # Check raw length first so oversized input is never copied by strip()
+    if len(topic) > _MAX_TOPIC_LEN:
+        logger.info("Topic rejected - too long", extra={"topic_length": len(topic)})
+        return (
+            False,
+            f"Topic is too long. Please keep it concise (under {_MAX_TOPIC_LEN} characters).",
+        )
+
+    if not topic.strip():
+        return True, ""
+
+    if _FAST_ALLOW.fullmatch(topic):
+        logger.debug("Topic approved by local allow-list", extra={"topic_length": len(topic)})
+        return True, ""
+
+    cached = _get_cached(topic)
+    if cached is not None:
+        logger.debug("Moderation cache hit", extra={"topic_length": len(topic)})
+        return cached
+
+    with _breaker_lock:
+        breaker_open = time.monotonic() < _breaker["open_until"]
+    if breaker_open:
+        logger.debug("Moderation circuit open - allowing", extra={"topic_length": len(topic)})
+        return True, ""
+
+    return None
+
+
+def is_topic_appropriate(topic: str, client: Anthropic | None = None) -> tuple[bool, str]:
     """
     Check if a topic is appropriate for philosophical dialogue using AI moderation.
 
+    Obviously safe topics are approved locally by a precompiled pattern;
+    everything else is sent to the moderation API, whose
+    decisions are cached per normalized topic for an hour.
+
     Args:
         topic: The topic string to check
+        client: Anthropic client to use; defaults to the shared module client
 
     Returns:
         Tuple of (is_appropriate: bool, reason: str)
         - If appropriate: (True, "")
         - If inappropriate: (False, "reason for rejection")
     """
-    if not topic or not topic.strip():
-        return True, ""
+    verdict = _decide_locally(topic)
+    if verdict is not None:
+        return verdict
 
-    # Check length first (quick check before API call)
-    if len(topic) > 500:
-        logger.info("Topic rejected - too long", extra={"topic_length": len(topic)})
-        return False, "Topic is too long. Please keep it concise (under 500 characters)."
+    return _moderate_with_api(topic, client)
 
-    # Use Claude to moderate the content
-    try:
-        logger.debug("Starting content moderation", extra={"topic_length": len(topic)})
-        client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
 
-        moderation_prompt = f"""You are a content moderator for a philosophical dialogue platform. Evaluate if this topic is appropriate for respectful philosophical discussion.
+def is_topics_appropriate(
+    topics: Sequence[str], client: Anthropic | None = None
+) -> list[tuple[bool, str]]:
+    """
+    Check several topics at once, sending all undecided topics in a single API call.
+
+    Each topic goes through the same local checks and cache as
+    is_topic_appropriate(); only the remainder is moderated, as numbered lists
+    of at most _BATCH_SIZE topics per request.
+
+    Args:
+        topics: The topic strings to check
+        client: Anthropic client to use; defaults to the shared module client
+
+    Returns:
+        List of (is_appropriate, reason) tuples in the same order as topics
+    """
+    verdicts = [_decide_locally(topic) for topic in topics]
+    pending = [i for i, verdict in enumerate(verdicts) if verdict is None]
 
-Topic: "{topic}"
+    if len(pending) == 1:
+        verdicts[pending[0]] = _moderate_with_api(topics[pending[0]], client)
+    else:
+        for start in range(0, len(pending), _BATCH_SIZE):
+            chunk = pending[start : start + _BATCH_SIZE]
+            batch = _moderate_batch_with_api([topics[i] for i in chunk], client)
+            for i, verdict in zip(chunk, batch, strict=True):
+                verdicts[i] = verdict
+
+    return verdicts
+
+
+# Static moderation instructions, sent as a cacheable system prompt
+_MODERATION_SYSTEM = """You are a content moderator for a philosophical dialogue platform. Evaluate if the user's topic is appropriate for respectful philosophical discussion.
 
 Criteria for rejection:
 - Explicitly sexual or pornographic content
@@ -59,43 +198,277 @@ Criteria for acceptance:
 
 Respond with ONLY:
 - "APPROPRIATE" if the topic is suitable for philosophical dialogue
-- "INAPPROPRIATE: [brief reason]" if it should be rejected
+- "INAPPROPRIATE: [brief reason]" if it should be rejected"""
+
+_MODERATION_SYSTEM_BLOCKS = [
+    {"type": "text", "text": _MODERATION_SYSTEM, "cache_control": {"type": "ephemeral"}}
+]
+
+# Per-topic user message with a single {topic} placeholder, filled via str.replace
+_MODERATION_TEMPLATE = """Topic: "{topic}"
 
 Response:"""
 
-        response = client.messages.create(
-            model="claude-3-5-haiku-20241022",  # Fast and cheap for moderation
+# Batch user message with a single {topics} placeholder (a numbered list)
+_BATCH_MODERATION_TEMPLATE = """Topics:
+{topics}
+
+Evaluate each topic separately. Respond with one line per topic, in order:
+- "N. APPROPRIATE" or
+- "N. INAPPROPRIATE: [brief reason]"
+
+Response:"""
+
+_MODERATION_MODEL = "claude-3-5-haiku-20241022"  # Fast and cheap for moderation
+_BATCH_SIZE = 20  # topics per batch request; keeps max_tokens (100 per topic) bounded
+
+_NUMBERED_LINE = re.compile(r"^\s*(\d+)[.):]\s*(.+)$", re.MULTILINE)
+
+
+@cache
+def _get_client() -> Anthropic:
+    """Return the shared Anthropic client, created on first use and reused afterwards."""
+    return Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+
+
+@rate_limited(calls=10, period=60)
+def _call_moderation_api(client: Anthropic, **kwargs: Any) -> Any:
+    """Send one moderation request; single and batch checks share this rate limit."""
+    return client.messages.create(**kwargs)
+
+
+def _reply_text(response: Any) -> str:
+    """Return the text of a moderation reply's first content block, or "" if it has none."""
+    return getattr(next(iter(response.content), None), "text", "")
+
+
+def _parse_response(text: str) -> tuple[bool, str] | None:
+    """
+    Parse a moderation reply of the form "APPROPRIATE" or "INAPPROPRIATE: reason".
+
+    Args:
+        text: Raw text returned by the moderation model
+
+    Returns:
+        (is_appropriate, reason) for a definitive reply, or None if unclear
+    """
+    stripped = text.strip()
+    if stripped.startswith("INAPPROPRIATE:"):
+        reason = stripped.removeprefix("INAPPROPRIATE:").strip()
+        return False, f"This topic may not be appropriate: {reason}"
+    if stripped.startswith("APPROPRIATE"):
+        return True, ""
+    return None
+
+
+def _moderate_with_api(topic: str, client: Anthropic | None = None) -> tuple[bool, str]:
+    """
+    Ask Claude whether a topic is appropriate, failing open on API and network errors.
+
+    Consecutive failures are counted towards the module circuit breaker.
+
+    Args:
+        topic: The topic string to check
+        client: Anthropic client to use; defaults to the shared module client
+
+    Returns:
+        Tuple of (is_appropriate: bool, reason: str)
+    """
+    try:
+        logger.debug("Starting content moderation", extra={"topic_length": len(topic)})
+        if client is None:
+            client = _get_client()
+
+        moderation_prompt = _MODERATION_TEMPLATE.replace("{topic}", topic)
+
+        response = _call_moderation_api(
+            client,
+            model=_MODERATION_MODEL,
             max_tokens=100,
+            system=_MODERATION_SYSTEM_BLOCKS,
             messages=[{"role": "user", "content": moderation_prompt}],
         )
+        _record_api_success()
 
-        result = response.content[0].text.strip()
+        result = _reply_text(response)
+        verdict = _parse_response(result)
 
-        if result.startswith("APPROPRIATE"):
-            logger.info("Topic approved", extra={"topic_length": len(topic)})
+        if verdict is None:
+            # If unclear response, err on the side of caution but be permissive
+            logger.debug("Unclear moderation response - allowing", extra={"response": result})
             return True, ""
-        elif result.startswith("INAPPROPRIATE:"):
-            reason = result.replace("INAPPROPRIATE:", "").strip()
+
+        if verdict[0]:
+            logger.info("Topic approved", extra={"topic_length": len(topic)})
+        else:
             logger.info(
                 "Topic rejected by moderation",
-                extra={"topic_length": len(topic), "reason": reason},
+                extra={"topic_length": len(topic), "reason": verdict[1]},
             )
-            return False, f"This topic may not be appropriate: {reason}"
-        else:
-            # If unclear response, err on the side of caution but be permissive
-            logger.debug("Unclear moderation response - allowing", extra={"response": result})
-            return True, ""
+        _store_cached(topic, verdict)
+        return verdict
 
-    except Exception as e:
+    except (AnthropicError, OSError) as e:
         # If moderation fails, log the error but allow the topic (fail open for better UX)
-        logger.warning(
-            "Content moderation error - failing open",
-            extra={"error": str(e), "topic_length": len(topic)},
-        )
+        _record_api_failure(e, topic_length=len(topic))
         return True, ""
 
 
-def get_alternative_suggestions(rejected_topic: str = "") -> list[str]:
+def _parse_numbered_response(text: str) -> dict[int, tuple[bool, str]]:
+    """
+    Parse a batch moderation reply of numbered "N. APPROPRIATE" style lines.
+
+    Args:
+        text: Raw text returned by the moderation model
+
+    Returns:
+        Mapping of topic number (1-based) to verdict; unclear lines are omitted
+    """
+    parsed: dict[int, tuple[bool, str]] = {}
+    for match in _NUMBERED_LINE.finditer(text):
+        verdict = _parse_response(match.group(2))
+        if verdict is not None:
+            parsed.setdefault(int(match.group(1)), verdict)
+    return parsed
+
+
+def _moderate_batch_with_api(
+    topics: list[str], client: Anthropic | None = None
+) -> list[tuple[bool, str]]:
+    """
+    Ask Claude about several topics in one request, failing open on API and network errors.
+
+    Args:
+        topics: The topic strings to check
+        client: Anthropic client to use; defaults to the shared module client
+
+    Returns:
+        List of (is_appropriate, reason) tuples in the same order as topics
+    """
+    # Collapse whitespace so a topic containing newlines cannot break the numbering
+    listing = "\n".join(f"{n}. {' '.join(topic.split())}" for n, topic in enumerate(topics, 1))
+
+    try:
+        logger.debug("Starting batch content moderation", extra={"topic_count": len(topics)})
+        if client is None:
+            client = _get_client()
+
+        response = _call_moderation_api(
+            client,
+            model=_MODERATION_MODEL,
+            max_tokens=100 * len(topics),
+            system=_MODERATION_SYSTEM_BLOCKS,
+            messages=[
+                {
+                    "role": "user",
+                    "content": _BATCH_MODERATION_TEMPLATE.replace("{topics}", listing),
+                }
+            ],
+        )
+        _record_api_success()
+
+        parsed = _parse_numbered_response(_reply_text(response))
+
+    except (AnthropicError, OSError) as e:
+        _record_api_failure(e, topic_count=len(topics))
+        return [(True, "")] * len(topics)
+
+    verdicts = []
+    for number, topic in enumerate(topics, 1):
+        verdict = parsed.get(number)
+        if verdict is None:
+            # Missing or unclear line: be permissive, as for a single topic
+            logger.debug("Unclear batch moderation line - allowing", extra={"line": number})
+            verdicts.append((True, ""))
+            continue
+        _store_cached(topic, verdict)
+        verdicts.append(verdict)
+
+    logger.info(
+        "Batch moderation complete",
+        extra={"topic_count": len(topics), "rejected": sum(not ok for ok, _ in verdicts)},
+    )
+    return verdicts
+
+
+def _record_api_success() -> None:
+    """Reset the circuit breaker's consecutive failure count."""
+    with _breaker_lock:
+        _breaker["fails"] = 0
+
+
+def _record_api_failure(error: Exception, **context: int) -> None:
+    """Log a moderation API failure and advance the circuit breaker."""
+    with _breaker_lock:
+        _breaker["fails"] += 1
+        fails = _breaker["fails"]
+        if fails >= _BREAKER_THRESHOLD:
+            _breaker["open_until"] = time.monotonic() + _BREAKER_COOLDOWN
+    if fails >= _BREAKER_THRESHOLD:
+        logger.warning(
+            "Moderation circuit opened",
+            extra={"failures": fails, "cooldown_seconds": _BREAKER_COOLDOWN},
+        )
+    logger.warning(
+        "Content moderation error - failing open",
+        extra={"error": str(error), **context},
+    )
+
+
+def _load_theme_data() -> dict:
+    """Read the bundled suggestion/theme resource shipped with the package."""
+    resource = resources.files("socratic_sofa").joinpath("content_filter_themes.json")
+    return json.loads(resource.read_text(encoding="utf-8"))
+
+
+_THEME_DATA = _load_theme_data()
+
+# Default philosophical questions
+_DEFAULT_SUGGESTIONS: tuple[str, ...] = tuple(_THEME_DATA["default"])
+
+# Theme keywords, in priority order: when a topic touches several themes the
+# first theme listed in the resource wins. Keywords match as plain substrings,
+# so inflections ("robots", "suffering", "morality") are caught without listing
+# every form.
+_THEME_KEYWORDS: Mapping[str, frozenset[str]] = MappingProxyType(
+    {theme: frozenset(spec["keywords"]) for theme, spec in _THEME_DATA["themes"].items()}
+)
+
+_THEME_SUGGESTIONS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {theme: tuple(spec["suggestions"]) for theme, spec in _THEME_DATA["themes"].items()}
+)
+
+del _THEME_DATA
+
+_THEME_PRIORITY = {theme: rank for rank, theme in enumerate(_THEME_KEYWORDS)}
+
+# One alternation of named groups, wrapped in a lookahead so that every position
+# of the topic is tried (keywords may overlap, e.g. "right"/"rights"). At each
+# position the alternation reports the highest-priority theme matching there.
+# Keywords are casefolded so topics are folded once and matched case-sensitively.
+_THEME_PATTERN = re.compile(
+    "(?=(?:"
+    + "|".join(
+        f"(?P<{theme}>{'|'.join(re.escape(word.casefold()) for word in sorted(words))})"
+        for theme, words in _THEME_KEYWORDS.items()
+    )
+    + "))"
+)
+
+
+def _detect_theme(topic_folded: str) -> str | None:
+    """Return the highest-priority theme mentioned in a casefolded topic, if any."""
+    best: str | None = None
+    for match in _THEME_PATTERN.finditer(topic_folded):
+        theme = match.lastgroup
+        if best is None or _THEME_PRIORITY[theme] < _THEME_PRIORITY[best]:
+            best = theme
+            if _THEME_PRIORITY[best] == 0:
+                break
+    return best
+
+
+def get_alternative_suggestions(rejected_topic: str = "") -> tuple[str, ...]:
     """
     Provide alternative philosophical topics when a topic is rejected.
 
@@ -106,189 +479,23 @@ def get_alternative_suggestions(rejected_topic: str = "") -> list[str]:
         rejected_topic: The topic that was rejected (optional)
 
     Returns:
-        List of suggested alternative topics, potentially themed to the rejected topic
+        Immutable tuple of suggested alternative topics, potentially themed to the
+        rejected topic. The same shared tuple is returned for a given theme.
     """
-    # Default philosophical questions
-    default_suggestions = [
-        "What is justice?",
-        "What is the good life?",
-        "Is morality relative or universal?",
-        "What is consciousness?",
-        "Do we have free will?",
-        "Can AI have rights?",
-        "What is truth?",
-        "Is beauty objective?",
-    ]
-
     # If no rejected topic provided, return defaults
     if not rejected_topic or not rejected_topic.strip():
-        return default_suggestions
-
-    # Thematic alternative suggestions based on keywords
-    topic_lower = rejected_topic.lower()
-
-    # Technology and AI themes
-    if any(
-        word in topic_lower
-        for word in ["ai", "robot", "technology", "computer", "digital", "internet", "social media"]
-    ):
-        return [
-            "Can AI have rights?",
-            "Should we fear artificial intelligence?",
-            "What is consciousness?",
-            "Can machines be creative?",
-            "What makes us human in a digital age?",
-            "Is privacy a fundamental right?",
-            "How should we regulate technology?",
-            "What is the nature of intelligence?",
-        ]
-
-    # Ethics and morality themes
-    if any(
-        word in topic_lower
-        for word in [
-            "moral",
-            "ethics",
-            "right",
-            "wrong",
-            "should",
-            "ought",
-            "good",
-            "bad",
-            "virtue",
-        ]
-    ):
-        return [
-            "Is morality relative or universal?",
-            "What is the good life?",
-            "Can morality exist without religion?",
-            "What is justice?",
-            "Are there universal human rights?",
-            "Is utilitarianism the best ethical framework?",
-            "What role should empathy play in ethics?",
-            "Can an action be both right and wrong?",
-        ]
-
-    # Politics and society themes
-    if any(
-        word in topic_lower
-        for word in [
-            "government",
-            "politics",
-            "society",
-            "democracy",
-            "freedom",
-            "liberty",
-            "law",
-            "rights",
-        ]
-    ):
-        return [
-            "What is justice?",
-            "What is the ideal form of government?",
-            "Are there limits to freedom of speech?",
-            "What is the social contract?",
-            "Should voting be mandatory?",
-            "What role should government play in our lives?",
-            "Are universal human rights possible?",
-            "Can democracy survive the digital age?",
-        ]
-
-    # Mind and consciousness themes
-    if any(
-        word in topic_lower
-        for word in [
-            "mind",
-            "consciousness",
-            "brain",
-            "thought",
-            "awareness",
-            "perception",
-            "mental",
-            "cognitive",
-        ]
-    ):
-        return [
-            "What is consciousness?",
-            "Do we have free will?",
-            "Is the mind separate from the brain?",
-            "What is the nature of reality?",
-            "Can we trust our perceptions?",
-            "What is the self?",
-            "Are our thoughts truly our own?",
-            "What is subjective experience?",
-        ]
-
-    # Existential and meaning themes
-    if any(
-        word in topic_lower
-        for word in [
-            "meaning",
-            "purpose",
-            "life",
-            "death",
-            "existence",
-            "existential",
-            "absurd",
-            "suffer",
-        ]
-    ):
-        return [
-            "What is the good life?",
-            "What makes life meaningful?",
-            "Is there inherent meaning in the universe?",
-            "How should we face mortality?",
-            "Can we create our own purpose?",
-            "What is happiness?",
-            "Is suffering necessary for meaning?",
-            "What is the examined life?",
-        ]
-
-    # Knowledge and truth themes
-    if any(
-        word in topic_lower
-        for word in [
-            "truth",
-            "knowledge",
-            "belief",
-            "fact",
-            "science",
-            "evidence",
-            "prove",
-            "certain",
-        ]
-    ):
-        return [
-            "What is truth?",
-            "Can we know anything with certainty?",
-            "What is the relationship between science and philosophy?",
-            "Is objective truth possible?",
-            "What is knowledge?",
-            "Can faith and reason coexist?",
-            "What are the limits of human knowledge?",
-            "How do we distinguish truth from opinion?",
-        ]
-
-    # Aesthetic and beauty themes
-    if any(
-        word in topic_lower
-        for word in ["art", "beauty", "aesthetic", "music", "creative", "culture"]
-    ):
-        return [
-            "Is beauty objective?",
-            "What is art?",
-            "Can machines be creative?",
-            "What is the purpose of art?",
-            "Is there a universal aesthetic?",
-            "What makes something beautiful?",
-            "Can art be immoral?",
-            "What is the value of aesthetic experience?",
-        ]
-
-    # If no theme detected, return defaults
-    return default_suggestions
+        return _DEFAULT_SUGGESTIONS
+
+    # Thematic alternative suggestions based on keywords (single pass over the topic)
+    topic_folded = rejected_topic.casefold()
+    theme = _detect_theme(topic_folded)
+    if theme is None:
+        return _DEFAULT_SUGGESTIONS
+
+    return _THEME_SUGGESTIONS[theme]
 
 
+@cache
 def get_rejection_guidelines() -> str:
     """
     Provide general guidelines about what makes topics appropriate for philosophical discourse.
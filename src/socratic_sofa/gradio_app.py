@@ -148,6 +148,9 @@ PROGRESS_STAGES = [
     ("Evaluation", "⚖️"),
 ]
 
+# Seconds to wait for a task completion before re-checking the crew thread
+TASK_POLL_TIMEOUT = 0.5
+
 
 def create_progress_html(current_stage: int, start_time: float = None) -> str:
     """
@@ -334,7 +337,7 @@ def run_socratic_dialogue_streaming(dropdown_topic: str, custom_topic: str):
         while crew_thread.is_alive() or not task_queue.empty():
             try:
                 # Check for completed tasks (non-blocking with timeout)
-                task_output = task_queue.get(timeout=0.5)
+                task_output = task_queue.get(timeout=TASK_POLL_TIMEOUT)
 
                 # Determine which task just completed based on order
                 if task_index < len(task_names):
@@ -8,13 +8,17 @@ Provides consistent, structured logging across the application with:
 - Performance timing utilities
 """
 
+import json
 import logging
 import sys
 import time
+from collections import ChainMap
 from contextlib import contextmanager
 from functools import wraps
 from typing import Any
 
+import orjson
+
 # Configure base logging
 LOG_LEVEL = logging.INFO
 LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
@@ -54,30 +58,63 @@ def setup_logging(level: int = LOG_LEVEL, json_output: bool = False) -> logging.
     return root_logger
 
 
+# Attributes every LogRecord carries; anything else on a record came from ``extra=``
+_STD_LOGRECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message",
+    "asctime",
+}
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    """Serialize a log payload with orjson, falling back to the stdlib for what it rejects."""
+    try:
+        return orjson.dumps(data, default=str).decode()
+    except TypeError:
+        # e.g. non-string keys or integers wider than 64 bits
+        return json.dumps(data, default=str)
+
+
+_PLAIN_RECORD_TEMPLATE = '{"timestamp":"%s","level":%s,"logger":%s,"message":%s}'
+
+# Quote a string the way orjson does (non-ASCII characters left unescaped)
+_escape = json.JSONEncoder(ensure_ascii=False).encode
+
+
 class JsonFormatter(logging.Formatter):
     """JSON formatter for structured log output."""
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
-        import json
-        from datetime import UTC, datetime
+        # Build the UTC timestamp from the record's own creation time (millisecond precision)
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+        timestamp = f"{timestamp}.{int(record.msecs):03d}Z"
+        message = record.getMessage()
+
+        # Fields passed via ``extra=`` (anything beyond the standard attributes)
+        extras = {k: v for k, v in record.__dict__.items() if k not in _STD_LOGRECORD_ATTRS}
+
+        # Plain records only need their strings escaped, so skip building a dict
+        if not extras and not record.exc_info:
+            return _PLAIN_RECORD_TEMPLATE % (
+                timestamp,
+                _escape(record.levelname),
+                _escape(record.name),
+                _escape(message),
+            )
 
         log_data = {
-            "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+            "timestamp": timestamp,
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": message,
+            **extras,
         }
 
-        # Add extra fields if present
-        if hasattr(record, "extra"):
-            log_data.update(record.extra)
-
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        return _dumps(log_data)
 
 
 class LoggerAdapter(logging.LoggerAdapter):
@@ -99,8 +136,8 @@ class LoggerAdapter(logging.LoggerAdapter):
 
     def with_context(self, **context: Any) -> "LoggerAdapter":
         """Create a new adapter with additional context."""
-        new_extra = {**self.extra, **context}
-        return LoggerAdapter(self.logger, new_extra)
+        # Layer the new keys over the parent's context instead of copying it
+        return LoggerAdapter(self.logger, ChainMap(context, self.extra))
 
 
 def get_logger(name: str, **context: Any) -> LoggerAdapter:
@@ -162,25 +199,29 @@ def log_function_call(logger: LoggerAdapter | None = None):
         def wrapper(*args, **kwargs):
             func_logger = logger or get_logger(func.__module__)
             func_name = func.__qualname__
+            # Skip building entry/exit records entirely when DEBUG is filtered out
+            debug_enabled = func_logger.isEnabledFor(logging.DEBUG)
 
-            func_logger.debug(
-                f"Entering {func_name}",
-                extra={"function": func_name, "event": "function_entry"},
-            )
+            if debug_enabled:
+                func_logger.debug(
+                    f"Entering {func_name}",
+                    extra={"function": func_name, "event": "function_entry"},
+                )
 
             start_time = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
-                elapsed = time.perf_counter() - start_time
 
-                func_logger.debug(
-                    f"Exiting {func_name} after {elapsed:.3f}s",
-                    extra={
-                        "function": func_name,
-                        "event": "function_exit",
-                        "elapsed_seconds": elapsed,
-                    },
-                )
+                if debug_enabled:
+                    elapsed = time.perf_counter() - start_time
+                    func_logger.debug(
+                        f"Exiting {func_name} after {elapsed:.3f}s",
+                        extra={
+                            "function": func_name,
+                            "event": "function_exit",
+                            "elapsed_seconds": elapsed,
+                        },
+                    )
                 return result
 
             except Exception as e:
@@ -1,8 +1,11 @@
 #!/usr/bin/env python
+import json
 import sys
 import warnings
 from datetime import datetime
 
+from orjson import loads as _json_loads
+
 from socratic_sofa.crew import SocraticSofa
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
@@ -70,13 +73,11 @@ def run_with_trigger():
     """
     Run the crew with trigger payload.
     """
-    import json
-
     if len(sys.argv) < 2:
         raise Exception("No trigger payload provided. Please provide JSON payload as argument.")
 
     try:
-        trigger_payload = json.loads(sys.argv[1])
+        trigger_payload = _json_loads(sys.argv[1])
     except json.JSONDecodeError:
         raise Exception("Invalid JSON payload provided as argument")
 
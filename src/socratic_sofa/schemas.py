@@ -5,12 +5,17 @@ These schemas ensure consistent, well-formatted output from CrewAI tasks
 for better readability in the Gradio interface.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Build each model's validator on first use rather than at import time
+_DEFERRED = ConfigDict(defer_build=True)
 
 
 class TopicOutput(BaseModel):
     """Structured output for the propose_topic task."""
 
+    model_config = _DEFERRED
+
     topic: str = Field(description="The philosophical topic or question for the dialogue")
     context: str = Field(
         description="Brief context explaining why this topic is philosophically significant"
@@ -25,6 +30,8 @@ class TopicOutput(BaseModel):
 class SocraticQuestion(BaseModel):
     """A single Socratic question with its purpose."""
 
+    model_config = _DEFERRED
+
     question: str = Field(description="The Socratic question itself")
     purpose: str = Field(
         description="Brief explanation of what this question aims to reveal or challenge"
@@ -34,6 +41,8 @@ class SocraticQuestion(BaseModel):
 class InquiryOutput(BaseModel):
     """Structured output for the propose and oppose tasks (Socratic inquiries)."""
 
+    model_config = _DEFERRED
+
     philosophical_angle: str = Field(
         description="The specific philosophical perspective or angle being explored"
     )
@@ -51,6 +60,8 @@ class InquiryOutput(BaseModel):
 class CriterionScore(BaseModel):
     """Score for a single evaluation criterion."""
 
+    model_config = _DEFERRED
+
     score: int = Field(description="Score from 1-5", ge=1, le=5)
     assessment: str = Field(description="Brief assessment explaining the score")
 
@@ -58,6 +69,8 @@ class CriterionScore(BaseModel):
 class InquiryEvaluation(BaseModel):
     """Evaluation of a single inquiry."""
 
+    model_config = _DEFERRED
+
     question_quality: CriterionScore = Field(
         description="Assessment of whether questions genuinely probe or merely lead"
     )
@@ -75,6 +88,8 @@ class InquiryEvaluation(BaseModel):
 class JudgmentOutput(BaseModel):
     """Structured output for the judge_task (dialectic evaluation)."""
 
+    model_config = _DEFERRED
+
     first_inquiry: InquiryEvaluation = Field(description="Evaluation of the first line of inquiry")
     second_inquiry: InquiryEvaluation = Field(
         description="Evaluation of the second/alternative line of inquiry"
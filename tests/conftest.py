@@ -3,9 +3,14 @@
 This module provides common fixtures and configuration for all tests.
 """
 
+import copy
+import inspect
 import os
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -59,6 +64,35 @@ def outputs_dir(project_root: Path) -> Path:
     return project_root / "outputs"
 
 
+# Parsed crew YAML configs, shared by every module that uses cached_crew_yaml
+_CREW_YAML: dict[Path, dict] = {}
+
+
+@pytest.fixture(scope="module")
+def cached_crew_yaml(module_mocker) -> None:
+    """Parse the crew's agents.yaml and tasks.yaml once per test session.
+
+    Every SocraticSofa() otherwise re-parses both files through CrewAI's
+    loader. The parsed configs are kept for the whole session, but the loader
+    is only replaced within modules that request this fixture. Each caller gets
+    a deep copy, so per-instance config edits stay isolated.
+
+    Args:
+        module_mocker: Module-scoped pytest-mock fixture
+    """
+    from socratic_sofa.crew import SocraticSofa
+
+    load_yaml = SocraticSofa.load_yaml
+
+    def cached_load_yaml(config_path: Path) -> dict:
+        key = Path(config_path)
+        if key not in _CREW_YAML:
+            _CREW_YAML[key] = load_yaml(config_path)
+        return copy.deepcopy(_CREW_YAML[key])
+
+    module_mocker.patch.object(SocraticSofa, "load_yaml", staticmethod(cached_load_yaml))
+
+
 @pytest.fixture
 def mock_api_key(monkeypatch: pytest.MonkeyPatch) -> Generator[str, None, None]:
     """Provide a mock Anthropic API key for testing.
@@ -118,6 +152,18 @@ def sample_response() -> str:
     return "Yes, justice means giving people what they have earned through their actions."
 
 
+@pytest.fixture(scope="session")
+def topics_data() -> dict:
+    """Load the bundled topic library once per test session.
+
+    Returns:
+        Parsed topics.yaml data; treat as read-only
+    """
+    from socratic_sofa.gradio_app import load_topics_data
+
+    return load_topics_data()
+
+
 @pytest.fixture
 def temp_output_dir(tmp_path: Path) -> Path:
     """Provide a temporary directory for test outputs.
@@ -152,3 +198,153 @@ def reset_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("ANTHROPIC_API_KEY", original_api_key)
     else:
         monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def reset_content_filter_state() -> Generator[None, None, None]:
+    """Reset the content filter's moderation cache, breaker and client around each test.
+
+    Cached decisions, failure counts and the shared client would otherwise leak
+    between tests that reuse topics, simulate API errors or patch Anthropic.
+    """
+    from socratic_sofa import content_filter
+
+    def reset() -> None:
+        content_filter._moderation_cache.clear()
+        content_filter._breaker.update(fails=0, open_until=0.0)
+        content_filter._get_client.cache_clear()
+
+    reset()
+    yield
+    reset()
+
+
+@dataclass(slots=True)
+class FakeContent:
+    """Stand-in for an Anthropic text content block."""
+
+    text: str = "APPROPRIATE"
+
+
+@dataclass(slots=True)
+class FakeResponse:
+    """Stand-in for an Anthropic message response."""
+
+    content: list[FakeContent]
+
+
+@dataclass(slots=True)
+class FakeCreate:
+    """Recording stand-in for ``client.messages.create``."""
+
+    response: FakeResponse
+    call_args: tuple | None = None
+    call_count: int = 0
+
+    @property
+    def called(self) -> bool:
+        return self.call_count > 0
+
+    def __call__(self, **kwargs) -> FakeResponse:
+        self.call_args = ((), kwargs)
+        self.call_count += 1
+        return self.response
+
+    def reset(self) -> None:
+        self.call_args = None
+        self.call_count = 0
+
+
+@dataclass(slots=True)
+class FakeMessages:
+    create: FakeCreate
+
+
+@dataclass(slots=True)
+class FakeAnthropic:
+    """Minimal typed stand-in for the Anthropic client."""
+
+    messages: FakeMessages
+
+
+_SHARED_CONTENT = FakeContent()
+_SHARED_CLIENT = FakeAnthropic(FakeMessages(FakeCreate(FakeResponse([_SHARED_CONTENT]))))
+
+
+@contextmanager
+def _patch_anthropic(text: str = "APPROPRIATE") -> Generator[MagicMock, None, None]:
+    """Patch the content filter's Anthropic class with the shared fake client.
+
+    The class mock is autospecced, so constructor calls with arguments the real
+    Anthropic client does not accept fail immediately.
+
+    Args:
+        text: Moderation reply the fake client returns
+
+    Yields:
+        The patched Anthropic class; its ``return_value`` is the fake client
+    """
+    _SHARED_CONTENT.text = text
+    _SHARED_CLIENT.messages.create.reset()
+    with patch(
+        "socratic_sofa.content_filter.Anthropic", autospec=True, return_value=_SHARED_CLIENT
+    ) as anthropic_class:
+        yield anthropic_class
+
+
+@pytest.fixture(scope="session")
+def patch_anthropic() -> Callable[..., AbstractContextManager[MagicMock]]:
+    """Provide a context manager that patches Anthropic with a canned reply.
+
+    Returns:
+        ``patch_anthropic(text="APPROPRIATE")`` context manager
+    """
+    return _patch_anthropic
+
+
+@pytest.fixture(scope="module")
+def anthropic_stub() -> Generator[tuple[FakeAnthropic, FakeContent], None, None]:
+    """Patch the content filter's Anthropic client once per test module.
+
+    Yields:
+        Tuple of (fake client, fake content block) shared by the module
+    """
+    with _patch_anthropic():
+        yield _SHARED_CLIENT, _SHARED_CONTENT
+
+
+@pytest.fixture
+def mock_anthropic(
+    anthropic_stub: tuple[FakeAnthropic, FakeContent],
+) -> tuple[FakeAnthropic, FakeContent]:
+    """Provide the module's Anthropic stub, reset to an APPROPRIATE reply.
+
+    Args:
+        anthropic_stub: Module-scoped Anthropic stub fixture
+
+    Returns:
+        Tuple of (fake client, fake content block); set ``content.text`` per test
+    """
+    client, content = anthropic_stub
+    content.text = "APPROPRIATE"
+    client.messages.create.reset()
+    return client, content
+
+
+@pytest.fixture(autouse=True)
+def unthrottled_moderation(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Bypass the moderation API rate limit so tests never sleep on it.
+
+    The throttle is shared process state (10 calls/minute) and is covered by
+    the rate limiter tests; here it would only make test order matter.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+    """
+    from socratic_sofa import content_filter
+
+    monkeypatch.setattr(
+        content_filter,
+        "_call_moderation_api",
+        inspect.unwrap(content_filter._call_moderation_api),
+    )
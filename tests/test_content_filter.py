@@ -3,37 +3,27 @@ Unit tests for content_filter module.
 Tests content moderation and alternative suggestions functionality.
 """
 
-from unittest.mock import Mock
+import inspect
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
+import anthropic
+import httpx
 import pytest
 
 from socratic_sofa.content_filter import (
+    _call_moderation_api,
     get_alternative_suggestions,
     get_rejection_guidelines,
     is_topic_appropriate,
+    is_topics_appropriate,
 )
 
 
 class TestIsTopicAppropriate:
     """Test suite for is_topic_appropriate function."""
 
-    @pytest.fixture
-    def mock_anthropic(self, mocker):
-        """Fixture to mock Anthropic client."""
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_content = Mock()
-
-        # Set up nested mock structure for response.content[0].text
-        mock_content.text = "APPROPRIATE"
-        mock_response.content = [mock_content]
-        mock_client.messages.create.return_value = mock_response
-
-        # Mock the Anthropic class constructor
-        mocker.patch("socratic_sofa.content_filter.Anthropic", return_value=mock_client)
-
-        return mock_client, mock_content
-
     def test_empty_topic_returns_appropriate(self):
         """Test that empty topic returns (True, '')."""
         is_appropriate, reason = is_topic_appropriate("")
@@ -55,6 +45,18 @@ class TestIsTopicAppropriate:
         assert "too long" in reason.lower()
         assert "500 characters" in reason
 
+    def test_huge_topic_rejected_without_strip(self):
+        """Test that oversized topics are rejected before any stripped copy is made."""
+
+        class NoStrip(str):
+            def strip(self, *args):
+                raise AssertionError("strip() called on oversized topic")
+
+        is_appropriate, reason = is_topic_appropriate(NoStrip("x" * 10_000_000))
+
+        assert is_appropriate is False
+        assert "too long" in reason.lower()
+
     def test_topic_exactly_500_chars_is_acceptable(self, mock_anthropic):
         """Test that topic with exactly 500 characters passes length check."""
         mock_client, mock_content = mock_anthropic
@@ -68,99 +70,181 @@ class TestIsTopicAppropriate:
         # Verify API was called
         assert mock_client.messages.create.called
 
-    def test_appropriate_response_returns_true(self, mock_anthropic):
-        """Test that 'APPROPRIATE' response returns (True, '')."""
-        mock_client, mock_content = mock_anthropic
-        mock_content.text = "APPROPRIATE"
+    @pytest.mark.parametrize(
+        ("response_text", "expected_bool", "reason_substr"),
+        [
+            ("APPROPRIATE", True, ""),
+            ("INAPPROPRIATE: Contains explicit content", False, "Contains explicit content"),
+            ("INAPPROPRIATE:   Hate speech   ", False, "Hate speech"),
+            ("MAYBE", True, ""),
+            ("APPROPRIATE for discussion", True, ""),
+        ],
+        ids=["appropriate", "inappropriate", "extra_whitespace", "unclear", "partial_match"],
+    )
+    def test_response_maps_to_verdict(
+        self, mock_anthropic, response_text, expected_bool, reason_substr
+    ):
+        """Test that each moderation reply maps to the expected (bool, reason).
+
+        Unclear replies fail open with (True, '').
+        """
+        _, mock_content = mock_anthropic
+        mock_content.text = response_text
+
+        is_appropriate, reason = is_topic_appropriate("Is justice always fair?")
+
+        assert is_appropriate is expected_bool
+        if expected_bool:
+            assert reason == ""
+        else:
+            assert reason.startswith("This topic may not be appropriate:")
+            assert reason_substr in reason
+
+    @pytest.mark.parametrize(
+        "api_error",
+        [
+            anthropic.APIConnectionError(
+                request=httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+            ),
+            ConnectionError("Network unavailable"),
+        ],
+        ids=["api_connection_error", "network_error"],
+    )
+    def test_api_error_fails_open(self, mocker, caplog, api_error):
+        """Test that API and network errors return (True, '') and log a warning."""
+        mocker.patch("socratic_sofa.content_filter.Anthropic", side_effect=api_error)
 
-        is_appropriate, reason = is_topic_appropriate("What is justice?")
+        # Capture logs from the socratic_sofa logger hierarchy
+        with caplog.at_level(logging.WARNING, logger="socratic_sofa"):
+            is_appropriate, reason = is_topic_appropriate("some topic")
 
         assert is_appropriate is True
         assert reason == ""
+        assert any("Content moderation error" in r.getMessage() for r in caplog.records)
 
-    def test_inappropriate_response_returns_false_with_reason(self, mock_anthropic):
-        """Test that 'INAPPROPRIATE: reason' response returns (False, reason)."""
-        mock_client, mock_content = mock_anthropic
-        mock_content.text = "INAPPROPRIATE: Contains explicit content"
+    def test_unexpected_exception_propagates(self, mocker):
+        """Test that programming errors are not swallowed by the fail-open path."""
+        mocker.patch("socratic_sofa.content_filter.Anthropic", side_effect=ValueError("bug"))
 
-        is_appropriate, reason = is_topic_appropriate("inappropriate topic")
+        with pytest.raises(ValueError, match="bug"):
+            is_topic_appropriate("Is this a bug or a feature?")
 
-        assert is_appropriate is False
-        assert "This topic may not be appropriate:" in reason
-        assert "Contains explicit content" in reason
+    @pytest.mark.parametrize(
+        "content", [[], [SimpleNamespace(type="tool_use")]], ids=["empty", "non_text"]
+    )
+    def test_malformed_reply_treated_as_unclear(self, content):
+        """Test that a reply without a text block is allowed rather than raising."""
+        response = SimpleNamespace(content=content)
+        client = SimpleNamespace(messages=SimpleNamespace(create=lambda **kwargs: response))
 
-    def test_inappropriate_response_with_extra_whitespace(self, mock_anthropic):
-        """Test that inappropriate response handles whitespace correctly."""
-        mock_client, mock_content = mock_anthropic
-        mock_content.text = "INAPPROPRIATE:   Hate speech   "
+        assert is_topic_appropriate("Is a reply without text a reply?", client) == (True, "")
 
-        is_appropriate, reason = is_topic_appropriate("hate topic")
+    def test_circuit_breaker_opens_after_repeated_failures(self, mocker):
+        """Test that the API is skipped after repeated consecutive failures."""
+        from socratic_sofa import content_filter
 
-        assert is_appropriate is False
-        assert "Hate speech" in reason
+        mock_cls = mocker.patch(
+            "socratic_sofa.content_filter.Anthropic",
+            side_effect=ConnectionError("Network unavailable"),
+        )
 
-    def test_unclear_response_returns_true(self, mock_anthropic):
-        """Test that unclear/unexpected response returns (True, '') - fail open."""
-        mock_client, mock_content = mock_anthropic
-        mock_content.text = "MAYBE"
+        for i in range(content_filter._BREAKER_THRESHOLD):
+            assert is_topic_appropriate(f"Is outage number {i} meaningful?") == (True, "")
+        assert mock_cls.call_count == content_filter._BREAKER_THRESHOLD
 
-        is_appropriate, reason = is_topic_appropriate("ambiguous topic")
+        assert is_topic_appropriate("Is one more outage meaningful?") == (True, "")
+        assert mock_cls.call_count == content_filter._BREAKER_THRESHOLD
 
-        assert is_appropriate is True
-        assert reason == ""
+    def test_circuit_breaker_counts_concurrent_failures(self, mocker):
+        """Test that failures recorded from several handler threads are all counted."""
+        from socratic_sofa import content_filter
 
-    def test_partial_match_appropriate_returns_true(self, mock_anthropic):
-        """Test that response starting with 'APPROPRIATE' returns True."""
-        mock_client, mock_content = mock_anthropic
-        mock_content.text = "APPROPRIATE for discussion"
+        mocker.patch.object(content_filter, "logger")
+        error = ConnectionError("Network unavailable")
 
-        is_appropriate, reason = is_topic_appropriate("some topic")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: content_filter._record_api_failure(error), range(400)))
 
-        assert is_appropriate is True
-        assert reason == ""
+        assert content_filter._breaker["fails"] == 400
 
-    def test_api_exception_returns_true_fail_open(self, mocker, caplog):
-        """Test that API exception returns (True, '') to fail open."""
-        import logging
+    def test_circuit_breaker_closes_after_cooldown(self, mock_anthropic, mocker):
+        """Test that the API is retried once the breaker cooldown has elapsed."""
+        from socratic_sofa import content_filter
 
-        # Mock Anthropic to raise an exception
-        mocker.patch("socratic_sofa.content_filter.Anthropic", side_effect=Exception("API Error"))
+        mock_client, _ = mock_anthropic
+        mock_time = mocker.patch("socratic_sofa.content_filter.time")
+        mock_time.monotonic.return_value = 1000.0
+        mocker.patch.dict(
+            content_filter._breaker,
+            {"fails": content_filter._BREAKER_THRESHOLD, "open_until": 1010.0},
+        )
 
-        # Capture logs from the socratic_sofa logger hierarchy
-        with caplog.at_level(logging.WARNING, logger="socratic_sofa"):
-            is_appropriate, reason = is_topic_appropriate("some topic")
+        is_topic_appropriate("Is patience a virtue?")
+        assert mock_client.messages.create.called is False
 
-        assert is_appropriate is True
-        assert reason == ""
+        mock_time.monotonic.return_value = 1010.0
+        is_topic_appropriate("Is patience a virtue?")
+        assert mock_client.messages.create.call_count == 1
+        assert content_filter._breaker["fails"] == 0
 
-        # Check that warning was logged (check message or formatted text)
-        log_text = caplog.text
-        assert "Content moderation error" in log_text or any(
-            "Content moderation error" in record.message for record in caplog.records
-        )
+    def test_api_helper_is_rate_limited(self, monkeypatch, mocker):
+        """Test that the shared API call allows 10 calls a minute, then waits out the window."""
+        clock = mocker.Mock(return_value=0.0)
+        sleeps = []
 
-    def test_api_network_error_returns_true(self, mocker, caplog):
-        """Test that network errors fail open gracefully."""
-        import logging
+        def sleep(seconds):
+            sleeps.append(seconds)
+            clock.return_value += seconds
 
-        mocker.patch(
-            "socratic_sofa.content_filter.Anthropic",
-            side_effect=ConnectionError("Network unavailable"),
-        )
+        # The ratelimit limiter is the ``self`` captured by the wrapper under sleep_and_retry
+        limiter = inspect.getclosurevars(_call_moderation_api.__wrapped__).nonlocals["self"]
+        monkeypatch.setattr(limiter, "clock", clock)
+        monkeypatch.setattr(limiter, "last_reset", 0.0)
+        monkeypatch.setattr(limiter, "num_calls", 0)
+        mocker.patch("ratelimit.decorators.time", SimpleNamespace(sleep=sleep))
+        client = mocker.Mock()
 
-        # Capture logs from the socratic_sofa logger hierarchy
-        with caplog.at_level(logging.WARNING, logger="socratic_sofa"):
-            is_appropriate, reason = is_topic_appropriate("test topic")
+        for _ in range(10):
+            _call_moderation_api(client)
+        assert sleeps == []
 
-        assert is_appropriate is True
-        assert reason == ""
+        _call_moderation_api(client)
+        assert sleeps == [60.0]
+
+        clock.return_value += 61
+        _call_moderation_api(client)
+        assert sleeps == [60.0]
+        assert client.messages.create.call_count == 12
+
+    def test_injected_client_is_used_without_constructing_one(self, mocker):
+        """Test that a passed-in client is used directly instead of the shared one."""
+        anthropic_class = mocker.patch("socratic_sofa.content_filter.Anthropic")
+        client = mocker.Mock()
+        client.messages.create.return_value.content = [mocker.Mock(text="INAPPROPRIATE: Spam")]
 
-        # Check that warning was logged (check message or formatted text)
-        log_text = caplog.text
-        assert "Content moderation error" in log_text or any(
-            "Content moderation error" in record.message for record in caplog.records
+        is_appropriate, reason = is_topic_appropriate("Is spam a virtue?", client=client)
+
+        assert is_appropriate is False
+        assert "Spam" in reason
+        client.messages.create.assert_called_once()
+        anthropic_class.assert_not_called()
+
+    def test_default_client_is_reused_across_calls(self, mock_anthropic, mocker):
+        """Test that the shared client is constructed once, not per moderation call."""
+        from socratic_sofa import content_filter
+
+        mock_client, _ = mock_anthropic
+        anthropic_class = mocker.patch(
+            "socratic_sofa.content_filter.Anthropic", return_value=mock_client
         )
 
+        is_topic_appropriate("Is patience a virtue?")
+        is_topic_appropriate("Is courage a virtue?")
+
+        assert mock_client.messages.create.call_count == 2
+        assert anthropic_class.call_count == 1
+        assert content_filter._get_client() is mock_client
+
     def test_api_called_with_correct_parameters(self, mock_anthropic):
         """Test that Anthropic API is called with correct parameters."""
         mock_client, mock_content = mock_anthropic
@@ -179,21 +263,34 @@ class TestIsTopicAppropriate:
         assert len(kwargs["messages"]) == 1
         assert kwargs["messages"][0]["role"] == "user"
         assert topic in kwargs["messages"][0]["content"]
+        assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert topic not in kwargs["system"][0]["text"]
 
     def test_moderation_prompt_includes_topic(self, mock_anthropic):
         """Test that the moderation prompt includes the topic being evaluated."""
         mock_client, mock_content = mock_anthropic
         mock_content.text = "APPROPRIATE"
 
-        topic = "Do we have free will?"
+        topic = "Is free will compatible with determinism?"
         is_topic_appropriate(topic)
 
         call_args = mock_client.messages.create.call_args
         prompt = call_args[1]["messages"][0]["content"]
+        system = call_args[1]["system"][0]["text"]
 
         assert topic in prompt
-        assert "content moderator" in prompt.lower()
-        assert "philosophical" in prompt.lower()
+        assert "content moderator" in system.lower()
+        assert "philosophical" in system.lower()
+
+    def test_moderation_prompt_keeps_braces_in_topic(self, mock_anthropic):
+        """Test that braces in a topic are inserted literally into the prompt."""
+        mock_client, _ = mock_anthropic
+
+        topic = "Is {topic} a {placeholder} for meaning?"
+        is_topic_appropriate(topic)
+
+        prompt = mock_client.messages.create.call_args[1]["messages"][0]["content"]
+        assert f'Topic: "{topic}"' in prompt
 
     def test_multiple_calls_with_different_topics(self, mock_anthropic):
         """Test multiple calls work correctly with different topics."""
@@ -213,231 +310,367 @@ class TestIsTopicAppropriate:
         # Verify both calls were made
         assert mock_client.messages.create.call_count == 2
 
+    def test_cache_hit_skips_api_call(self, mock_anthropic):
+        """Test that a repeated topic is answered from the moderation cache."""
+        mock_client, mock_content = mock_anthropic
+        mock_content.text = "INAPPROPRIATE: Trolling"
+
+        first = is_topic_appropriate("Is this a troll topic?")
+        second = is_topic_appropriate("  IS THIS A TROLL TOPIC?  ")
 
-class TestGetAlternativeSuggestions:
-    """Test suite for get_alternative_suggestions function."""
+        assert first == second
+        assert first[0] is False
+        assert mock_client.messages.create.call_count == 1
 
-    def test_returns_non_empty_list(self):
-        """Test that function returns a non-empty list."""
-        suggestions = get_alternative_suggestions()
+    def test_cache_respects_ttl(self, mock_anthropic, mocker):
+        """Test that cached decisions expire after the TTL."""
+        from socratic_sofa import content_filter
 
-        assert isinstance(suggestions, list)
-        assert len(suggestions) > 0
+        mock_client, _ = mock_anthropic
+        mock_time = mocker.patch("socratic_sofa.content_filter.time")
+        mock_time.monotonic.return_value = 1000.0
 
-    def test_all_items_are_strings(self):
-        """Test that all items in the list are strings."""
-        suggestions = get_alternative_suggestions()
+        is_topic_appropriate("Is time an illusion?")
+        mock_time.monotonic.return_value = 1000.0 + content_filter._TTL - 1
+        is_topic_appropriate("Is time an illusion?")
+        assert mock_client.messages.create.call_count == 1
 
-        assert all(isinstance(item, str) for item in suggestions)
+        mock_time.monotonic.return_value = 1000.0 + content_filter._TTL
+        is_topic_appropriate("Is time an illusion?")
+        assert mock_client.messages.create.call_count == 2
 
-    def test_all_strings_are_non_empty(self):
-        """Test that all suggested topics are non-empty strings."""
-        suggestions = get_alternative_suggestions()
+    def test_cache_evicts_least_recently_used(self, mock_anthropic, mocker):
+        """Test that the cache is bounded and evicts the least recently used decision."""
+        from socratic_sofa import content_filter
 
-        assert all(len(item.strip()) > 0 for item in suggestions)
+        mock_client, _ = mock_anthropic
+        mocker.patch.object(content_filter, "_CACHE_MAXSIZE", 2)
 
-    def test_contains_expected_philosophical_topics(self):
-        """Test that suggestions contain expected philosophical topics."""
-        suggestions = get_alternative_suggestions()
+        is_topic_appropriate("Is time an illusion?")
+        is_topic_appropriate("Is space an illusion?")
+        is_topic_appropriate("Is time an illusion?")  # hit; now most recently used
+        is_topic_appropriate("Is motion an illusion?")  # evicts space
+        assert mock_client.messages.create.call_count == 3
+        assert len(content_filter._moderation_cache) == 2
 
-        # Check for some expected topics
-        expected_topics = [
-            "What is justice?",
-            "What is the good life?",
-            "Is morality relative or universal?",
-            "What is consciousness?",
-            "Do we have free will?",
+        is_topic_appropriate("Is time an illusion?")
+        assert mock_client.messages.create.call_count == 3
+        is_topic_appropriate("Is space an illusion?")
+        assert mock_client.messages.create.call_count == 4
+
+    def test_unclear_response_not_cached(self, mock_anthropic):
+        """Test that only definitive moderation decisions are cached."""
+        mock_client, mock_content = mock_anthropic
+        mock_content.text = "MAYBE"
+
+        is_topic_appropriate("ambiguous topic")
+        is_topic_appropriate("ambiguous topic")
+
+        assert mock_client.messages.create.call_count == 2
+
+    @pytest.mark.parametrize(
+        "topic",
+        ["What is justice?", "Do we have free will?", "consciousness", "Does virtue exist?"],
+    )
+    def test_fast_allow_skips_api(self, mock_anthropic, topic):
+        """Test that canonical philosophical questions are approved without an API call."""
+        mock_client, _ = mock_anthropic
+
+        is_appropriate, reason = is_topic_appropriate(topic)
+
+        assert is_appropriate is True
+        assert reason == ""
+        assert mock_client.messages.create.called is False
+
+    def test_safe_keyword_in_longer_topic_still_moderated(self, mock_anthropic):
+        """Test that the allow-list only short-circuits whole canonical questions."""
+        mock_client, _ = mock_anthropic
+
+        is_topic_appropriate("What is justice for people who deserve violence?")
+
+        assert mock_client.messages.create.called is True
+
+    @pytest.mark.parametrize(
+        "topic",
+        ["Should pornography be legal?", "Should snuff films be illegal?", "Is NSFW art immoral?"],
+    )
+    def test_sensitive_policy_questions_left_to_api(self, mock_anthropic, topic):
+        """Test that policy questions on explicit subjects are left to the moderation API."""
+        mock_client, _ = mock_anthropic
+
+        is_topic_appropriate(topic)
+
+        assert mock_client.messages.create.called is True
+
+
+class TestIsTopicsAppropriate:
+    """Test suite for batch moderation via is_topics_appropriate."""
+
+    def test_batch_uses_single_api_call(self, mock_anthropic):
+        """Test that undecided topics are moderated together in one request."""
+        mock_client, mock_content = mock_anthropic
+        mock_content.text = "1. APPROPRIATE\n2. INAPPROPRIATE: Explicit content"
+
+        results = is_topics_appropriate(["Is lying ever right?", "some bad topic"])
+
+        assert results == [
+            (True, ""),
+            (False, "This topic may not be appropriate: Explicit content"),
         ]
+        assert mock_client.messages.create.call_count == 1
+        kwargs = mock_client.messages.create.call_args[1]
+        assert "1. Is lying ever right?\n2. some bad topic" in kwargs["messages"][0]["content"]
+        assert kwargs["max_tokens"] == 200
 
-        for expected in expected_topics:
-            assert expected in suggestions
+    def test_large_batch_split_into_bounded_requests(self, mocker):
+        """Test that a large batch is sent in fixed-size chunks, bounding max_tokens."""
+        from socratic_sofa import content_filter
 
-    def test_contains_modern_philosophical_topics(self):
-        """Test that suggestions include modern philosophical questions."""
-        suggestions = get_alternative_suggestions()
+        size = content_filter._BATCH_SIZE
+        reply = "\n".join(f"{n}. APPROPRIATE" for n in range(1, size + 1))
+        client = mocker.Mock()
+        client.messages.create.return_value.content = [SimpleNamespace(text=reply)]
+        topics = [f"Is outlier number {i} meaningful?" for i in range(2 * size + 1)]
 
-        # Modern topics
-        modern_topics = ["Can AI have rights?"]
+        results = is_topics_appropriate(topics, client=client)
 
-        for modern in modern_topics:
-            assert modern in suggestions
+        assert results == [(True, "")] * len(topics)
+        calls = client.messages.create.call_args_list
+        assert [call.kwargs["max_tokens"] for call in calls] == [100 * size, 100 * size, 100]
+        assert f"1. {topics[size]}" in calls[1].kwargs["messages"][0]["content"]
 
-    def test_returns_same_list_on_multiple_calls(self):
-        """Test that function returns consistent results across multiple calls."""
-        suggestions1 = get_alternative_suggestions()
-        suggestions2 = get_alternative_suggestions()
+    def test_batch_local_decisions_skip_api(self, mock_anthropic):
+        """Test that empty, oversized and fast-path topics never reach the API."""
+        mock_client, _ = mock_anthropic
 
-        assert suggestions1 == suggestions2
+        results = is_topics_appropriate(["What is justice?", "", "x" * 501])
 
-    def test_minimum_number_of_suggestions(self):
-        """Test that there are at least 5 alternative suggestions."""
-        suggestions = get_alternative_suggestions()
+        assert [ok for ok, _ in results] == [True, True, False]
+        assert mock_client.messages.create.called is False
 
-        assert len(suggestions) >= 5
+    def test_batch_mixes_local_and_api_results_in_order(self, mock_anthropic):
+        """Test that API verdicts are slotted back into their original positions."""
+        mock_client, mock_content = mock_anthropic
+        mock_content.text = "1. INAPPROPRIATE: Trolling\n2. APPROPRIATE"
 
-    def test_suggestions_are_questions(self):
-        """Test that most suggestions are formatted as questions."""
-        suggestions = get_alternative_suggestions()
+        results = is_topics_appropriate(["troll topic", "What is justice?", "Is art useful?"])
 
-        # At least 80% should end with '?'
-        question_count = sum(1 for s in suggestions if s.strip().endswith("?"))
-        assert question_count >= len(suggestions) * 0.8
+        assert results[0] == (False, "This topic may not be appropriate: Trolling")
+        assert results[1:] == [(True, ""), (True, "")]
+        prompt = mock_client.messages.create.call_args[1]["messages"][0]["content"]
+        assert "What is justice?" not in prompt
 
-    def test_with_empty_rejected_topic(self):
-        """Test that empty rejected topic returns default suggestions."""
-        suggestions = get_alternative_suggestions("")
+    def test_batch_missing_line_fails_open(self, mock_anthropic):
+        """Test that topics without a parseable line are allowed and not cached."""
+        mock_client, mock_content = mock_anthropic
+        mock_content.text = "2. INAPPROPRIATE: Hate speech"
 
-        assert isinstance(suggestions, list)
-        assert len(suggestions) > 0
-        assert "What is justice?" in suggestions
+        results = is_topics_appropriate(["first topic", "second topic"])
 
-    def test_with_whitespace_rejected_topic(self):
-        """Test that whitespace rejected topic returns default suggestions."""
-        suggestions = get_alternative_suggestions("   \t\n  ")
+        assert results == [(True, ""), (False, "This topic may not be appropriate: Hate speech")]
+        is_topic_appropriate("first topic")
+        assert mock_client.messages.create.call_count == 2
 
-        assert isinstance(suggestions, list)
-        assert "What is justice?" in suggestions
+    def test_batch_results_are_cached(self, mock_anthropic):
+        """Test that batch verdicts feed the single-topic cache."""
+        mock_client, mock_content = mock_anthropic
+        mock_content.text = "1. APPROPRIATE\n2. APPROPRIATE"
+
+        is_topics_appropriate(["Is art useful?", "Is time real?"])
+        assert is_topic_appropriate("is art useful?") == (True, "")
+
+        assert mock_client.messages.create.call_count == 1
+
+    def test_batch_api_error_fails_open(self, mocker):
+        """Test that an API failure allows every pending topic."""
+        mocker.patch(
+            "socratic_sofa.content_filter.Anthropic",
+            side_effect=ConnectionError("Network unavailable"),
+        )
+
+        assert is_topics_appropriate(["first topic", "second topic"]) == [(True, ""), (True, "")]
+
+    def test_empty_batch(self, mock_anthropic):
+        """Test that an empty batch returns an empty list without calling the API."""
+        mock_client, _ = mock_anthropic
 
-    def test_technology_theme_suggestions(self):
-        """Test that technology-themed topics get related suggestions."""
-        tech_topics = [
+        assert is_topics_appropriate([]) == []
+        assert mock_client.messages.create.called is False
+
+
+# theme -> (sample topics, expected substrings in some suggestion, anchor suggestion)
+THEME_CASES = {
+    "technology": (
+        [
             "Can AI destroy humanity?",
             "Should we ban robots?",
             "What about computer ethics?",
             "Is the internet making us dumber?",
             "Should we fear technology?",
-        ]
-
-        for topic in tech_topics:
-            suggestions = get_alternative_suggestions(topic)
-
-            # Should contain technology-related suggestions
-            assert any(
-                "AI" in s or "technology" in s or "machine" in s or "digital" in s
-                for s in suggestions
-            )
-            # Verify it's returning the technology theme set
-            assert "Can AI have rights?" in suggestions
-
-    def test_ethics_theme_suggestions(self):
-        """Test that ethics-themed topics get related suggestions."""
-        ethics_topics = [
+        ],
+        ("ai", "technology", "machine", "digital"),
+        "Can AI have rights?",
+    ),
+    "ethics": (
+        [
             "Is stealing always wrong?",
             "What makes an action moral?",
             "Should we help the poor?",
             "Are there ethical absolutes?",
             "What is virtue?",
-        ]
-
-        for topic in ethics_topics:
-            suggestions = get_alternative_suggestions(topic)
-
-            # Should contain ethics-related suggestions
-            assert any(
-                "moral" in s.lower() or "ethics" in s.lower() or "good" in s.lower()
-                for s in suggestions
-            )
-            assert "Is morality relative or universal?" in suggestions
-
-    def test_politics_theme_suggestions(self):
-        """Test that politics-themed topics get related suggestions."""
-        politics_topics = [
+        ],
+        ("moral", "ethics", "good"),
+        "Is morality relative or universal?",
+    ),
+    "politics": (
+        [
             "Should government control everything?",
             "What is the best form of democracy?",
             "Are there limits to freedom?",
             "What are our rights?",
             "How should society be organized?",
-        ]
-
-        for topic in politics_topics:
-            suggestions = get_alternative_suggestions(topic)
-
-            # Should contain politics-related suggestions
-            assert any(
-                "government" in s.lower()
-                or "democracy" in s.lower()
-                or "freedom" in s.lower()
-                or "rights" in s.lower()
-                for s in suggestions
-            )
-            assert "What is justice?" in suggestions
-
-    def test_consciousness_theme_suggestions(self):
-        """Test that consciousness-themed topics get related suggestions."""
-        consciousness_topics = [
+        ],
+        ("government", "democracy", "freedom", "rights"),
+        "What is justice?",
+    ),
+    "consciousness": (
+        [
             "What is the mind?",
             "How does the brain work?",
             "Are we aware of everything we think?",
             "What is perception?",
             "Is consciousness an illusion?",
-        ]
-
-        for topic in consciousness_topics:
-            suggestions = get_alternative_suggestions(topic)
-
-            # Should contain consciousness-related suggestions
-            assert "What is consciousness?" in suggestions
-            assert any("mind" in s.lower() or "consciousness" in s.lower() for s in suggestions)
-
-    def test_existential_theme_suggestions(self):
-        """Test that existential-themed topics get related suggestions."""
-        existential_topics = [
+        ],
+        ("mind", "consciousness"),
+        "What is consciousness?",
+    ),
+    "existential": (
+        [
             "What is the meaning of life?",
             "Why do we exist?",
             "How should we face death?",
             "What is our purpose?",
             "Why is there suffering?",
-        ]
-
-        for topic in existential_topics:
-            suggestions = get_alternative_suggestions(topic)
-
-            # Should contain existential suggestions
-            assert any(
-                "meaning" in s.lower() or "life" in s.lower() or "purpose" in s.lower()
-                for s in suggestions
-            )
-            assert "What is the good life?" in suggestions
-
-    def test_knowledge_theme_suggestions(self):
-        """Test that knowledge-themed topics get related suggestions."""
-        knowledge_topics = [
+        ],
+        ("meaning", "life", "purpose"),
+        "What is the good life?",
+    ),
+    "knowledge": (
+        [
             "What is truth?",
             "How do we prove things?",
             "Can we believe in science?",
             "What is evidence?",
             "How do we know anything?",
-        ]
-
-        for topic in knowledge_topics:
-            suggestions = get_alternative_suggestions(topic)
-
-            # Should contain knowledge-related suggestions
-            assert "What is truth?" in suggestions
-            assert any("knowledge" in s.lower() or "truth" in s.lower() for s in suggestions)
-
-    def test_aesthetics_theme_suggestions(self):
-        """Test that aesthetics-themed topics get related suggestions."""
-        aesthetic_topics = [
+        ],
+        ("knowledge", "truth"),
+        "What is truth?",
+    ),
+    "aesthetics": (
+        [
             "What makes art beautiful?",
             "Is music universal?",
             "Can machines create art?",
             "What is beauty?",
             "Is culture relative?",
-        ]
+        ],
+        ("beauty", "art", "aesthetic", "creative"),
+        "Is beauty objective?",
+    ),
+}
 
-        for topic in aesthetic_topics:
-            suggestions = get_alternative_suggestions(topic)
 
-            # Should contain aesthetic suggestions
-            assert any(
-                "beauty" in s.lower()
-                or "art" in s.lower()
-                or "aesthetic" in s.lower()
-                or "creative" in s.lower()
-                for s in suggestions
-            )
-            assert "Is beauty objective?" in suggestions
+THEMED_TOPICS = [
+    pytest.param(topic, any_of, anchor, id=f"{theme}-{topic}")
+    for theme, (topics, any_of, anchor) in THEME_CASES.items()
+    for topic in topics
+]
+
+
+@pytest.fixture(scope="module")
+def suggestions():
+    """Default suggestions, computed once for the module."""
+    return get_alternative_suggestions()
+
+
+class TestGetAlternativeSuggestions:
+    """Test suite for get_alternative_suggestions function."""
+
+    def test_suggestions_invariants(self, suggestions):
+        """Test the default suggestions' shape and contents in a single pass.
+
+        They are non-empty strings, at least five of them, mostly (80%)
+        phrased as questions, and include the core and modern topics.
+        """
+        expected_topics = {
+            "What is justice?",
+            "What is the good life?",
+            "Is morality relative or universal?",
+            "What is consciousness?",
+            "Do we have free will?",
+            "Can AI have rights?",
+        }
+        types_ok = non_empty_ok = True
+        question_count = 0
+        missing_expected = set(expected_topics)
+        for item in suggestions:
+            if not isinstance(item, str):
+                types_ok = False
+                continue
+            stripped = item.strip()
+            non_empty_ok = non_empty_ok and bool(stripped)
+            question_count += stripped.endswith("?")
+            missing_expected.discard(item)
+
+        assert isinstance(suggestions, (list, tuple))
+        assert len(suggestions) >= 5
+        assert types_ok
+        assert non_empty_ok
+        assert question_count >= len(suggestions) * 0.8
+        assert not missing_expected
+
+    def test_returns_same_list_on_multiple_calls(self, suggestions):
+        """Test that function returns consistent results across multiple calls."""
+        assert get_alternative_suggestions() == suggestions
+
+    def test_returns_same_object_identity(self):
+        """Test that the default suggestions are a shared constant, not rebuilt per call."""
+        assert get_alternative_suggestions() is get_alternative_suggestions()
+
+    def test_with_empty_rejected_topic(self):
+        """Test that empty rejected topic returns default suggestions."""
+        suggestions = get_alternative_suggestions("")
+
+        assert isinstance(suggestions, (list, tuple))
+        assert len(suggestions) > 0
+        assert "What is justice?" in suggestions
+
+    def test_with_whitespace_rejected_topic(self):
+        """Test that whitespace rejected topic returns default suggestions."""
+        suggestions = get_alternative_suggestions("   \t\n  ")
+
+        assert isinstance(suggestions, (list, tuple))
+        assert "What is justice?" in suggestions
+
+    @pytest.mark.parametrize(("topic", "any_of", "required_suggestion"), THEMED_TOPICS)
+    def test_theme_suggestions(self, topic, any_of, required_suggestion):
+        """Test that themed topics get related suggestions, including the theme's anchor."""
+        suggestions = get_alternative_suggestions(topic)
+
+        assert any(sub in s.lower() for s in suggestions for sub in any_of)
+        assert required_suggestion in suggestions
+
+    @pytest.mark.parametrize(
+        ("topic", "themed_suggestion"),
+        [
+            ("Why is there suffering?", "Is suffering necessary for meaning?"),
+            ("Do robots dream?", "Should we fear artificial intelligence?"),
+            ("Is morality learned?", "Can morality exist without religion?"),
+        ],
+    )
+    def test_inflected_keywords_match_theme(self, topic, themed_suggestion):
+        """Test that keywords match inside inflected words, not only as whole tokens."""
+        assert themed_suggestion in get_alternative_suggestions(topic)
 
     def test_unthemed_topic_returns_defaults(self):
         """Test that topics with no clear theme return default suggestions."""
@@ -494,6 +727,10 @@ class TestGetAlternativeSuggestions:
 class TestGetRejectionGuidelines:
     """Test suite for get_rejection_guidelines function."""
 
+    def test_guidelines_identity_cached(self):
+        """Test that the guidelines string is built once and reused."""
+        assert get_rejection_guidelines() is get_rejection_guidelines()
+
     def test_returns_non_empty_string(self):
         """Test that function returns a non-empty string."""
         guidelines = get_rejection_guidelines()
@@ -4,10 +4,71 @@ Tests focus on class structure and type annotations without
 requiring API keys or executing the crew.
 """
 
+import os
+from types import SimpleNamespace
+from typing import get_type_hints
 from unittest.mock import MagicMock, patch
 
+import crewai.project.utils as crewai_project_utils
+import pytest
+from crewai.agents.cache.cache_handler import CacheHandler
+
 from socratic_sofa.crew import SocraticSofa
 
+pytestmark = pytest.mark.usefixtures("cached_crew_yaml")
+
+
+@pytest.fixture(scope="module")
+def crew_type_hints():
+    """Resolve SocraticSofa's annotations once for the module."""
+    return get_type_hints(SocraticSofa)
+
+
+@pytest.fixture(scope="module")
+def callback_annotation_str(crew_type_hints):
+    """Render the resolved task_callback annotation to a string once."""
+    return str(crew_type_hints["task_callback"])
+
+
+@pytest.fixture(scope="class")
+def built_crew(class_mocker):
+    """Construct SocraticSofa once per class with Agent patched.
+
+    CrewAI's @CrewBase loads config and calls the @agent methods during
+    instantiation, so one construction records every Agent call.
+    """
+    mock_agent_class = class_mocker.patch("socratic_sofa.crew.Agent", return_value=MagicMock())
+    return SocraticSofa(), mock_agent_class
+
+
+@pytest.fixture(scope="class")
+def crew_mocks(class_mocker):
+    """Patch Task and Crew once for every test in a class."""
+    class_mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test-mock-openai-key-for-testing"})
+    return SimpleNamespace(
+        task=class_mocker.patch("socratic_sofa.crew.Task"),
+        crew=class_mocker.patch("socratic_sofa.crew.Crew"),
+    )
+
+
+@pytest.fixture(scope="class")
+def shared_crew(crew_mocks):
+    """Build a single SocraticSofa per test class."""
+    return SocraticSofa()
+
+
+@pytest.fixture
+def crew_instance(shared_crew, crew_mocks, monkeypatch):
+    """Hand out the shared SocraticSofa with clean mocks and memo cache.
+
+    CrewAI memoizes @agent/@task/@crew results per instance in a module-level
+    CacheHandler, so each test gets a fresh one to observe its own calls.
+    """
+    monkeypatch.setattr(crewai_project_utils, "cache", CacheHandler())
+    crew_mocks.task.reset_mock()
+    crew_mocks.crew.reset_mock()
+    return shared_crew
+
 
 class TestSocraticSofaStructure:
     """Test the basic structure of SocraticSofa class."""
@@ -22,16 +83,12 @@ class TestSocraticSofaStructure:
         assert len(SocraticSofa.__doc__.strip()) > 0
         assert "SocraticSofa crew" in SocraticSofa.__doc__
 
-    def test_has_task_callback_annotation(self):
+    def test_has_task_callback_annotation(self, callback_annotation_str):
         """Test that task_callback has correct type annotation."""
-        annotations = SocraticSofa.__annotations__
-        assert "task_callback" in annotations
+        assert "task_callback" in SocraticSofa.__annotations__
 
         # Verify it's a callable type
-        callback_annotation = str(annotations["task_callback"])
-        assert (
-            "Callable" in callback_annotation or "collections.abc.Callable" in callback_annotation
-        )
+        assert "Callable" in callback_annotation_str
 
     def test_has_agents_annotation(self):
         """Test that agents attribute is annotated."""
@@ -43,86 +100,38 @@ class TestSocraticSofaStructure:
         annotations = SocraticSofa.__annotations__
         assert "tasks" in annotations
 
-    def test_has_socratic_questioner_method(self):
-        """Test that socratic_questioner agent method exists."""
-        assert hasattr(SocraticSofa, "socratic_questioner")
-
-    def test_has_judge_method(self):
-        """Test that judge agent method exists."""
-        assert hasattr(SocraticSofa, "judge")
-
-    def test_has_propose_topic_method(self):
-        """Test that propose_topic task method exists."""
-        assert hasattr(SocraticSofa, "propose_topic")
-
-    def test_has_propose_method(self):
-        """Test that propose task method exists."""
-        assert hasattr(SocraticSofa, "propose")
-
-    def test_has_oppose_method(self):
-        """Test that oppose task method exists."""
-        assert hasattr(SocraticSofa, "oppose")
-
-    def test_has_judge_task_method(self):
-        """Test that judge_task task method exists."""
-        assert hasattr(SocraticSofa, "judge_task")
-
-    def test_has_crew_method(self):
-        """Test that crew method exists."""
-        assert hasattr(SocraticSofa, "crew")
+    @pytest.mark.parametrize(
+        "attr",
+        [
+            "socratic_questioner",
+            "judge",
+            "propose_topic",
+            "propose",
+            "oppose",
+            "judge_task",
+            "crew",
+        ],
+    )
+    def test_class_has_attr(self, attr):
+        """Test that each agent, task and crew method exists."""
+        assert hasattr(SocraticSofa, attr)
 
 
 class TestSocraticSofaCallbackType:
     """Test the callback type annotation functionality."""
 
-    def test_callback_type_annotation_exists(self):
+    def test_callback_type_annotation_exists(self, crew_type_hints):
         """Test that task_callback has type annotation."""
-        from typing import get_type_hints
+        assert "task_callback" in crew_type_hints
 
-        hints = get_type_hints(SocraticSofa)
-        assert "task_callback" in hints
-
-    def test_callback_allows_callable(self):
+    def test_callback_allows_callable(self, callback_annotation_str):
         """Test that callback type allows Callable."""
-        from typing import get_type_hints
-
-        hints = get_type_hints(SocraticSofa)
-        callback_type = hints["task_callback"]
-
-        # Check it involves Callable
-        type_str = str(callback_type)
-        assert "Callable" in type_str or "collections.abc.Callable" in type_str
+        assert "Callable" in callback_annotation_str
 
-    def test_callback_allows_none(self):
+    def test_callback_allows_none(self, callback_annotation_str):
         """Test that callback type allows None."""
-        from typing import get_type_hints
-
-        hints = get_type_hints(SocraticSofa)
-        callback_type = hints["task_callback"]
-
         # Check it allows None (Union with None or Optional)
-        type_str = str(callback_type)
-        assert "None" in type_str or "Optional" in type_str
-
-
-class TestSocraticSofaMethodCount:
-    """Test that all expected methods are present."""
-
-    def test_has_two_agent_methods(self):
-        """Test that class has the 2 agent methods."""
-        agent_methods = ["socratic_questioner", "judge"]
-        for method in agent_methods:
-            assert hasattr(SocraticSofa, method), f"Missing agent method: {method}"
-
-    def test_has_four_task_methods(self):
-        """Test that class has the 4 task methods."""
-        task_methods = ["propose_topic", "propose", "oppose", "judge_task"]
-        for method in task_methods:
-            assert hasattr(SocraticSofa, method), f"Missing task method: {method}"
-
-    def test_has_crew_orchestration_method(self):
-        """Test that class has crew orchestration method."""
-        assert hasattr(SocraticSofa, "crew")
+        assert "None" in callback_annotation_str or "Optional" in callback_annotation_str
 
 
 class TestSocraticSofaClassDefault:
@@ -141,35 +150,20 @@ class TestSocraticSofaClassDefault:
 class TestSocraticSofaAgentCreation:
     """Test that agent methods return Agent instances."""
 
-    def test_socratic_questioner_returns_agent(self, mocker):
+    def test_socratic_questioner_returns_agent(self, built_crew):
         """Test socratic_questioner method returns an Agent."""
-        # Mock the Agent class where it's imported in the module
-        mock_agent_instance = MagicMock()
-        mock_agent_class = mocker.patch(
-            "socratic_sofa.crew.Agent", return_value=mock_agent_instance
-        )
-
-        # Create crew instance - CrewAI's @CrewBase loads config automatically
-        SocraticSofa()
+        _, mock_agent_class = built_crew
 
         # Agent should have been called with config for socratic_questioner
-        # The @agent decorator calls the method during class instantiation
         calls = mock_agent_class.call_args_list
         assert len(calls) >= 1
         # Check that socratic_questioner config was used
         configs_used = [c[1]["config"] for c in calls if "config" in c[1]]
         assert any("Socratic" in str(cfg.get("role", "")) for cfg in configs_used)
 
-    def test_judge_returns_agent(self, mocker):
+    def test_judge_returns_agent(self, built_crew):
         """Test judge method returns an Agent."""
-        # Mock the Agent class where it's imported in the module
-        mock_agent_instance = MagicMock()
-        mock_agent_class = mocker.patch(
-            "socratic_sofa.crew.Agent", return_value=mock_agent_instance
-        )
-
-        # Create crew instance - CrewAI's @CrewBase loads config automatically
-        SocraticSofa()
+        _, mock_agent_class = built_crew
 
         # Agent should have been called for both agents
         calls = mock_agent_class.call_args_list
@@ -185,15 +179,13 @@ class TestSocraticSofaAgentCreation:
 class TestSocraticSofaTaskCreation:
     """Test that task methods return Task instances."""
 
-    @patch("socratic_sofa.crew.Task")
-    def test_propose_topic_returns_task(self, mock_task_class):
+    def test_propose_topic_returns_task(self, crew_instance, crew_mocks):
         """Test propose_topic method returns a Task."""
-        # Mock the Task class
-        mock_task_instance = MagicMock()
-        mock_task_class.return_value = mock_task_instance
+        mock_task_class = crew_mocks.task
+        mock_task_class.return_value = MagicMock()
 
-        # Create crew instance and mock tasks_config
-        crew = SocraticSofa()
+        # Point the shared crew instance at a minimal tasks_config
+        crew = crew_instance
         crew.tasks_config = {
             "propose_topic": {
                 "description": "Propose a philosophical topic",
@@ -212,15 +204,13 @@ class TestSocraticSofaTaskCreation:
         assert call_kwargs["config"] == crew.tasks_config["propose_topic"]
         assert call_kwargs["callback"] is None
 
-    @patch("socratic_sofa.crew.Task")
-    def test_propose_returns_task_with_context(self, mock_task_class):
+    def test_propose_returns_task_with_context(self, crew_instance, crew_mocks):
         """Test propose method returns a Task with context."""
-        # Mock the Task class
-        mock_task_instance = MagicMock()
-        mock_task_class.return_value = mock_task_instance
+        mock_task_class = crew_mocks.task
+        mock_task_class.return_value = MagicMock()
 
-        # Create crew instance and mock configs
-        crew = SocraticSofa()
+        # Point the shared crew instance at minimal configs
+        crew = crew_instance
         crew.tasks_config = {
             "propose_topic": {"description": "Propose topic", "expected_output": "Topic"},
             "propose": {"description": "Propose argument", "expected_output": "Argument"},
@@ -242,15 +232,13 @@ class TestSocraticSofaTaskCreation:
         assert len(second_call_kwargs["context"]) == 1
         assert second_call_kwargs["callback"] == crew.task_callback
 
-    @patch("socratic_sofa.crew.Task")
-    def test_oppose_returns_task_with_context(self, mock_task_class):
+    def test_oppose_returns_task_with_context(self, crew_instance, crew_mocks):
         """Test oppose method returns a Task with propose context."""
-        # Mock the Task class
-        mock_task_instance = MagicMock()
-        mock_task_class.return_value = mock_task_instance
+        mock_task_class = crew_mocks.task
+        mock_task_class.return_value = MagicMock()
 
-        # Create crew instance and mock configs
-        crew = SocraticSofa()
+        # Point the shared crew instance at minimal configs
+        crew = crew_instance
         crew.tasks_config = {
             "propose_topic": {"description": "Topic", "expected_output": "Topic"},
             "propose": {"description": "Propose", "expected_output": "Argument"},
@@ -273,15 +261,13 @@ class TestSocraticSofaTaskCreation:
         assert len(third_call_kwargs["context"]) == 2
         assert third_call_kwargs["callback"] == crew.task_callback
 
-    @patch("socratic_sofa.crew.Task")
-    def test_judge_task_returns_task_with_all_context(self, mock_task_class):
+    def test_judge_task_returns_task_with_all_context(self, crew_instance, crew_mocks):
         """Test judge_task method returns a Task with full context."""
-        # Mock the Task class
-        mock_task_instance = MagicMock()
-        mock_task_class.return_value = mock_task_instance
+        mock_task_class = crew_mocks.task
+        mock_task_class.return_value = MagicMock()
 
-        # Create crew instance and mock configs
-        crew = SocraticSofa()
+        # Point the shared crew instance at minimal configs
+        crew = crew_instance
         crew.tasks_config = {
             "propose_topic": {"description": "Topic", "expected_output": "Topic"},
             "propose": {"description": "Propose", "expected_output": "Argument"},
@@ -309,17 +295,11 @@ class TestSocraticSofaTaskCreation:
 class TestSocraticSofaCrewCreation:
     """Test crew method."""
 
-    @patch("socratic_sofa.crew.Crew")
-    def test_crew_returns_crew_instance(self, mock_crew_class):
+    def test_crew_returns_crew_instance(self, crew_instance, crew_mocks):
         """Test crew method returns a Crew."""
-        # Mock the Crew class
-        mock_crew_instance = MagicMock()
-        mock_crew_class.return_value = mock_crew_instance
-
-        # Create crew instance
-        crew_obj = SocraticSofa()
-        crew_obj.agents = [MagicMock(), MagicMock()]
-        crew_obj.tasks = [MagicMock(), MagicMock(), MagicMock()]
+        mock_crew_class = crew_mocks.crew
+        mock_crew_class.return_value = MagicMock()
+        crew_obj = crew_instance
 
         # Call the method - this covers line 61
         result = crew_obj.crew()
@@ -332,23 +312,13 @@ class TestSocraticSofaCrewCreation:
         assert call_kwargs["tasks"] == crew_obj.tasks
         assert call_kwargs["verbose"] is True
 
-    @patch("socratic_sofa.crew.Crew")
     @patch("socratic_sofa.crew.Process")
-    def test_crew_has_sequential_process(self, mock_process, mock_crew_class):
+    def test_crew_has_sequential_process(self, mock_process, crew_instance, crew_mocks):
         """Test crew uses sequential process."""
-        # Mock the Crew class
-        mock_crew_instance = MagicMock()
-        mock_crew_class.return_value = mock_crew_instance
-
-        # Create crew instance
-        crew_obj = SocraticSofa()
-        crew_obj.agents = []
-        crew_obj.tasks = []
-
         # Call the method
-        crew_obj.crew()
+        crew_instance.crew()
 
         # Verify sequential process is used
-        call_kwargs = mock_crew_class.call_args[1]
+        call_kwargs = crew_mocks.crew.call_args[1]
         assert "process" in call_kwargs
         # The actual Process.sequential value will be used, not mocked
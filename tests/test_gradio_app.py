@@ -6,7 +6,6 @@ Tests cover:
 - Category filtering and random topic selection
 """
 
-from pathlib import Path
 from unittest.mock import mock_open
 
 import pytest
@@ -23,18 +22,25 @@ from socratic_sofa.gradio_app import (
 )
 
 
+@pytest.fixture(scope="module")
+def topics_summary():
+    """Flattened TOPICS and the set of category labels they carry, computed once."""
+    categories = {topic.split("]", 1)[0][1:] for topic in TOPICS if "]" in topic}
+    return {"topics": TOPICS, "categories": categories}
+
+
 class TestLoadTopics:
     """Test suite for topic loading functions."""
 
-    def test_returns_non_empty_list(self):
+    def test_returns_non_empty_list(self, topics_summary):
         """Should return a non-empty list of topics."""
-        topics = TOPICS
+        topics = topics_summary["topics"]
         assert isinstance(topics, list)
         assert len(topics) > 0
 
-    def test_topics_formatted_correctly(self):
+    def test_topics_formatted_correctly(self, topics_summary):
         """Should format topics as '[Category] Topic'."""
-        topics = TOPICS
+        topics = topics_summary["topics"]
 
         # Check that all topics follow the format
         for topic in topics:
@@ -49,16 +55,9 @@ class TestLoadTopics:
         assert "[Society & Politics] What is freedom?" in topics
         assert "[Modern Dilemmas] Should AI have rights?" in topics
 
-    def test_includes_multiple_categories(self):
+    def test_includes_multiple_categories(self, topics_summary):
         """Should include topics from multiple categories."""
-        topics = TOPICS
-
-        # Extract unique category names
-        categories = set()
-        for topic in topics:
-            if "]" in topic:
-                category = topic.split("]")[0].strip("[")
-                categories.add(category)
+        categories = topics_summary["categories"]
 
         # Should have multiple categories
         assert len(categories) > 5
@@ -66,14 +65,23 @@ class TestLoadTopics:
         assert "Ethics & Morality" in categories
         assert "Fun & Quirky" in categories
 
-    def test_fallback_on_file_error(self, mocker):
-        """Should return default topics when file cannot be loaded."""
-        # Mock Path to raise FileNotFoundError
-        mock_path = mocker.patch("socratic_sofa.gradio_app.Path")
-        mock_path.return_value.__truediv__.return_value = Path("/nonexistent/topics.yaml")
-
-        # Mock open to raise exception
-        mocker.patch("builtins.open", side_effect=FileNotFoundError("File not found"))
+    @pytest.mark.parametrize(
+        "error",
+        [
+            FileNotFoundError("File not found"),
+            yaml.YAMLError("Parse error"),
+            Exception("Unexpected error"),
+        ],
+        ids=["file_error", "yaml_parse_error", "generic_exception"],
+    )
+    def test_fallback_on_load_error(self, mocker, error):
+        """Should return default topics when the file cannot be read or parsed."""
+        if isinstance(error, yaml.YAMLError):
+            # The file opens fine but its contents fail to parse
+            mocker.patch("builtins.open", mock_open(read_data="invalid: yaml: content: {"))
+            mocker.patch("yaml.safe_load", side_effect=error)
+        else:
+            mocker.patch("builtins.open", side_effect=error)
 
         topics_data = load_topics_data()
 
@@ -81,72 +89,43 @@ class TestLoadTopics:
         assert "fallback" in topics_data
         assert topics_data["fallback"]["name"] == "Philosophy"
 
-    def test_fallback_on_yaml_parse_error(self, mocker):
-        """Should return default topics when YAML parsing fails."""
-        # Mock open to return invalid YAML
-        invalid_yaml = "invalid: yaml: content: {"
-        mocker.patch("builtins.open", mock_open(read_data=invalid_yaml))
-
-        # Mock yaml.safe_load to raise exception
-        mocker.patch("yaml.safe_load", side_effect=yaml.YAMLError("Parse error"))
-
-        topics_data = load_topics_data()
-
-        # Should return default fallback topics
-        assert "fallback" in topics_data
-
-    def test_fallback_on_generic_exception(self, mocker):
-        """Should return default topics on any unexpected exception."""
-        # Mock to raise a generic exception
-        mocker.patch("builtins.open", side_effect=Exception("Unexpected error"))
-
-        topics_data = load_topics_data()
-
-        # Should return default fallback topics
-        assert "fallback" in topics_data
-
 
 class TestCategoryFunctions:
     """Test suite for category filtering functions."""
 
-    def test_get_categories_returns_list(self):
+    def test_get_categories_returns_list(self, topics_data):
         """Should return list of categories with 'All Categories' first."""
-        topics_data = load_topics_data()
         categories = get_categories(topics_data)
 
         assert isinstance(categories, list)
         assert categories[0] == "All Categories"
         assert "Classic Philosophy" in categories
 
-    def test_get_topics_flat_returns_formatted_list(self):
+    def test_get_topics_flat_returns_formatted_list(self, topics_data):
         """Should return flat list with category prefixes."""
-        topics_data = load_topics_data()
         topics = get_topics_flat(topics_data)
 
         assert len(topics) > 0
         for topic in topics:
             assert "[" in topic and "]" in topic
 
-    def test_get_topics_by_category_all(self):
+    def test_get_topics_by_category_all(self, topics_data):
         """Should return all topics for 'All Categories'."""
-        topics_data = load_topics_data()
         topics = get_topics_by_category(topics_data, "All Categories")
 
         assert "✨ Let AI choose" in topics
         assert len(topics) > 50  # Many topics
 
-    def test_get_topics_by_category_specific(self):
+    def test_get_topics_by_category_specific(self, topics_data):
         """Should filter topics by specific category."""
-        topics_data = load_topics_data()
         topics = get_topics_by_category(topics_data, "Classic Philosophy")
 
         assert "✨ Let AI choose" in topics
         for topic in topics[1:]:  # Skip AI choose
             assert "[Classic Philosophy]" in topic
 
-    def test_get_random_topic_returns_valid_topic(self):
+    def test_get_random_topic_returns_valid_topic(self, topics_data):
         """Should return a random topic from the library."""
-        topics_data = load_topics_data()
         random_topic = get_random_topic(topics_data)
 
         assert isinstance(random_topic, str)
@@ -164,35 +143,6 @@ class TestHandleTopicSelection:
         )
         assert result == "Should we colonize Mars?"
 
-    def test_textbox_priority_with_whitespace(self):
-        """Should use textbox value even with extra whitespace."""
-        result = handle_topic_selection(
-            dropdown_value="[Classic Philosophy] What is justice?",
-            textbox_value="  Should we colonize Mars?  ",
-        )
-        assert result == "Should we colonize Mars?"
-
-    def test_empty_textbox_uses_dropdown(self):
-        """Should use dropdown value when textbox is empty."""
-        result = handle_topic_selection(
-            dropdown_value="[Classic Philosophy] What is justice?", textbox_value=""
-        )
-        assert result == "What is justice?"
-
-    def test_whitespace_only_textbox_uses_dropdown(self):
-        """Should use dropdown value when textbox contains only whitespace."""
-        result = handle_topic_selection(
-            dropdown_value="[Classic Philosophy] What is justice?", textbox_value="   "
-        )
-        assert result == "What is justice?"
-
-    def test_none_textbox_uses_dropdown(self):
-        """Should use dropdown value when textbox is None."""
-        result = handle_topic_selection(
-            dropdown_value="[Classic Philosophy] What is justice?", textbox_value=None
-        )
-        assert result == "What is justice?"
-
     def test_ai_choose_returns_empty_string(self):
         """Should return empty string when '✨ Let AI choose' is selected."""
         result = handle_topic_selection(dropdown_value="✨ Let AI choose", textbox_value="")
@@ -231,33 +181,49 @@ class TestHandleTopicSelection:
         result = handle_topic_selection(dropdown_value="Plain topic text", textbox_value="")
         assert result == "Plain topic text"
 
-    def test_empty_dropdown_returns_empty_string(self):
-        """Should return empty string when dropdown is empty."""
-        result = handle_topic_selection(dropdown_value="", textbox_value="")
-        assert result == ""
-
-    def test_none_dropdown_returns_empty_string(self):
-        """Should return empty string when dropdown is None."""
-        result = handle_topic_selection(dropdown_value=None, textbox_value="")
-        assert result == ""
-
-    def test_both_none_returns_empty_string(self):
-        """Should return empty string when both inputs are None."""
-        result = handle_topic_selection(dropdown_value=None, textbox_value=None)
-        assert result == ""
-
-    def test_both_empty_returns_empty_string(self):
-        """Should return empty string when both inputs are empty."""
-        result = handle_topic_selection(dropdown_value="", textbox_value="")
-        assert result == ""
+    @pytest.mark.parametrize(
+        ("dropdown", "textbox", "expected"),
+        [
+            ("[Classic Philosophy] What is justice?", "", "What is justice?"),
+            ("[Classic Philosophy] What is justice?", "   ", "What is justice?"),
+            ("[Classic Philosophy] What is justice?", None, "What is justice?"),
+            ("", "", ""),
+            (None, "", ""),
+            (None, None, ""),
+        ],
+        ids=[
+            "empty_textbox",
+            "whitespace_textbox",
+            "none_textbox",
+            "both_empty",
+            "none_dropdown",
+            "both_none",
+        ],
+    )
+    def test_empty_variants(self, dropdown, textbox, expected):
+        """Should fall back to the dropdown, or to '', when inputs are empty or None."""
+        assert handle_topic_selection(dropdown_value=dropdown, textbox_value=textbox) == expected
 
-    def test_textbox_strips_whitespace(self):
-        """Should strip leading and trailing whitespace from textbox."""
-        result = handle_topic_selection(
-            dropdown_value="[Classic Philosophy] What is justice?",
-            textbox_value="\n\t  What is happiness?  \n\t",
-        )
-        assert result == "What is happiness?"
+    @pytest.mark.parametrize(
+        ("dropdown", "textbox", "expected"),
+        [
+            ("", "  Custom Topic  ", "Custom Topic"),
+            (
+                "[Classic Philosophy] What is justice?",
+                "\n\t  What is happiness?  \n\t",
+                "What is happiness?",
+            ),
+            (
+                "[Classic Philosophy] What is justice?",
+                "  Should we colonize Mars?  ",
+                "Should we colonize Mars?",
+            ),
+        ],
+        ids=["empty_dropdown", "mixed_whitespace", "spaces_with_dropdown"],
+    )
+    def test_textbox_strip(self, dropdown, textbox, expected):
+        """Should strip surrounding whitespace, with or without a dropdown selection."""
+        assert handle_topic_selection(dropdown_value=dropdown, textbox_value=textbox) == expected
 
     @pytest.mark.parametrize(
         "textbox_input",
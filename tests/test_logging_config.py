@@ -3,11 +3,14 @@ Unit tests for logging_config module.
 Tests structured logging configuration and utilities.
 """
 
+import json
 import logging
-import time
+import re
+import sys
 
 import pytest
 
+from socratic_sofa import logging_config
 from socratic_sofa.logging_config import (
     JsonFormatter,
     LoggerAdapter,
@@ -53,89 +56,114 @@ class TestSetupLogging:
         assert isinstance(handler.formatter, JsonFormatter)
 
 
-class TestJsonFormatter:
-    """Test suite for JsonFormatter class."""
+@pytest.fixture(scope="module")
+def json_formatter():
+    """A single JsonFormatter shared across the module (it holds no per-record state)."""
+    return JsonFormatter()
 
-    def test_format_returns_valid_json(self):
-        """Test that format returns valid JSON string."""
-        import json
 
-        formatter = JsonFormatter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=10,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+@pytest.fixture(scope="module")
+def shared_logger():
+    """A single "test" adapter for tests that only need somewhere to log."""
+    return get_logger("test")
 
-        result = formatter.format(record)
-        parsed = json.loads(result)
 
-        assert isinstance(parsed, dict)
-
-    def test_format_includes_timestamp(self):
-        """Test that formatted output includes timestamp."""
-        import json
+class TestJsonFormatter:
+    """Test suite for JsonFormatter class."""
 
-        formatter = JsonFormatter()
+    @pytest.mark.parametrize(
+        ("level", "msg", "level_name"),
+        [
+            (logging.INFO, "My test message", "INFO"),
+            (logging.WARNING, "Warning message", "WARNING"),
+        ],
+    )
+    def test_format_core_fields(self, json_formatter, level, msg, level_name):
+        """Formatted output should be a JSON object with timestamp, level, logger and message."""
         record = logging.LogRecord(
             name="test",
-            level=logging.INFO,
+            level=level,
             pathname="test.py",
             lineno=10,
-            msg="Test message",
+            msg=msg,
             args=(),
             exc_info=None,
         )
 
-        result = formatter.format(record)
-        parsed = json.loads(result)
-
-        assert "timestamp" in parsed
-        assert parsed["timestamp"].endswith("Z")
+        parsed = json.loads(json_formatter.format(record))
 
-    def test_format_includes_level(self):
-        """Test that formatted output includes log level."""
-        import json
-
-        formatter = JsonFormatter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.WARNING,
-            pathname="test.py",
-            lineno=10,
-            msg="Warning message",
-            args=(),
-            exc_info=None,
+        assert isinstance(parsed, dict)
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[.]\d{3}Z", parsed["timestamp"])
+        assert parsed["level"] == level_name
+        assert parsed["logger"] == "test"
+        assert parsed["message"] == msg
+
+    def test_format_includes_extra_fields_only(self, json_formatter):
+        """Fields passed via extra= should appear; standard LogRecord attrs should not."""
+        record = logging.getLogger("test").makeRecord(
+            "test", logging.INFO, "test.py", 10, "Test message", (), None, extra={"request_id": "x"}
         )
 
-        result = formatter.format(record)
-        parsed = json.loads(result)
+        parsed = json.loads(json_formatter.format(record))
 
-        assert parsed["level"] == "WARNING"
+        assert parsed["request_id"] == "x"
+        assert "pathname" not in parsed
+        assert "lineno" not in parsed
 
-    def test_format_includes_message(self):
-        """Test that formatted output includes message."""
-        import json
-
-        formatter = JsonFormatter()
+    def test_fast_path_matches_slow_path(self, json_formatter):
+        """A record without extras should serialize exactly as the dict-based path would."""
         record = logging.LogRecord(
-            name="test",
+            name='odd "name"',
             level=logging.INFO,
             pathname="test.py",
             lineno=10,
-            msg="My test message",
-            args=(),
+            msg='Café \\ "%s"\n',
+            args=("ünïcode",),
             exc_info=None,
         )
 
-        result = formatter.format(record)
-        parsed = json.loads(result)
+        fast = json_formatter.format(record)
+        slow = logging_config._dumps(
+            {
+                "timestamp": json.loads(fast)["timestamp"],
+                "level": "INFO",
+                "logger": record.name,
+                "message": record.getMessage(),
+            }
+        )
 
-        assert parsed["message"] == "My test message"
+        assert fast == slow
+
+    def test_format_record_with_extras_and_exception(self, json_formatter):
+        """Extras, non-ASCII text and the traceback should all survive serialization."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                name="test",
+                level=logging.ERROR,
+                pathname="test.py",
+                lineno=10,
+                msg="Café %s",
+                args=("ünïcode",),
+                exc_info=sys.exc_info(),
+            )
+        record.__dict__.update({"topic": "What is justice?", "count": 3, "ratio": 0.5, "ok": True})
+
+        parsed = json.loads(json_formatter.format(record))
+        parsed.pop("timestamp")
+        exception = parsed.pop("exception")
+
+        assert parsed == {
+            "level": "ERROR",
+            "logger": "test",
+            "message": "Café ünïcode",
+            "topic": "What is justice?",
+            "count": 3,
+            "ratio": 0.5,
+            "ok": True,
+        }
+        assert "ValueError: boom" in exception
 
 
 class TestLoggerAdapter:
@@ -195,49 +223,38 @@ class TestGetLogger:
 class TestLogTiming:
     """Test suite for log_timing context manager."""
 
-    def test_logs_start_message(self, caplog):
-        """Test that log_timing logs start message."""
-        logger = get_logger("test")
-
-        with caplog.at_level(logging.INFO, logger="socratic_sofa"):
-            with log_timing(logger, "test_operation"):
-                pass
-
-        assert any("Starting test_operation" in record.message for record in caplog.records)
-
-    def test_logs_completion_message(self, caplog):
-        """Test that log_timing logs completion message."""
-        logger = get_logger("test")
-
+    def test_logs_start_and_completion_messages(self, caplog, shared_logger):
+        """Test that log_timing logs both start and completion messages."""
         with caplog.at_level(logging.INFO, logger="socratic_sofa"):
-            with log_timing(logger, "test_operation"):
+            with log_timing(shared_logger, "test_operation"):
                 pass
 
-        assert any("Completed test_operation" in record.message for record in caplog.records)
+        messages = caplog.messages
+        assert messages[0] == "Starting test_operation"
+        assert messages[1].startswith("Completed test_operation in ")
 
-    def test_logs_failure_on_exception(self, caplog):
+    def test_logs_failure_on_exception(self, caplog, shared_logger):
         """Test that log_timing logs failure on exception."""
-        logger = get_logger("test")
-
         with caplog.at_level(logging.ERROR, logger="socratic_sofa"):
             with pytest.raises(ValueError):
-                with log_timing(logger, "failing_operation"):
+                with log_timing(shared_logger, "failing_operation"):
                     raise ValueError("Test error")
 
-        assert any("Failed failing_operation" in record.message for record in caplog.records)
+        assert any(m.startswith("Failed failing_operation") for m in caplog.messages)
 
-    def test_includes_elapsed_time(self, caplog):
+    def test_includes_elapsed_time(self, caplog, monkeypatch, shared_logger):
         """Test that log_timing includes elapsed time."""
-        logger = get_logger("test")
+        ticks = iter([100.0, 100.1])
+        monkeypatch.setattr("socratic_sofa.logging_config.time.perf_counter", lambda: next(ticks))
 
         with caplog.at_level(logging.INFO, logger="socratic_sofa"):
-            with log_timing(logger, "timed_operation"):
-                time.sleep(0.1)
+            with log_timing(shared_logger, "timed_operation"):
+                pass
 
         # Check that completion message includes timing
         completion_records = [r for r in caplog.records if "Completed" in r.message]
         assert len(completion_records) == 1
-        assert "0.1" in completion_records[0].message or "0.2" in completion_records[0].message
+        assert "in 0.10s" in completion_records[0].message
 
 
 class TestLogFunctionCall:
@@ -267,6 +284,19 @@ class TestLogFunctionCall:
 
         assert any("Exiting" in record.message for record in caplog.records)
 
+    def test_skips_debug_logging_when_disabled(self, caplog, mocker):
+        """Entry/exit records should not be built when DEBUG is filtered out."""
+        logger = get_logger("disabled_debug")
+        caplog.set_level(logging.INFO, logger=logger.logger.name)
+        mock_debug = mocker.patch.object(LoggerAdapter, "debug")
+
+        @log_function_call(logger)
+        def test_func():
+            return "result"
+
+        assert test_func() == "result"
+        mock_debug.assert_not_called()
+
     def test_logs_exception(self, caplog):
         """Test that decorator logs exceptions."""
 
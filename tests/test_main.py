@@ -5,73 +5,85 @@ Tests the CLI functions with mocked CrewAI components.
 
 import json
 import sys
-from unittest.mock import MagicMock, Mock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
+from socratic_sofa import main
+
+_TRIGGER_PAYLOAD = {"topic": "test topic", "extra": "data"}
+_TRIGGER_PAYLOAD_JSON = json.dumps(_TRIGGER_PAYLOAD)
+
+
+def _stub_crew(result=None):
+    """Build a SocraticSofa stand-in whose crew exposes only Mock entry points."""
+    crew = SimpleNamespace(
+        kickoff=Mock(return_value=result), train=Mock(), replay=Mock(), test=Mock()
+    )
+    return Mock(return_value=SimpleNamespace(crew=lambda: crew)), crew
+
+
+def _inputs(call):
+    """Return the inputs dict passed to a recorded kickoff call."""
+    return call.kwargs["inputs"]
+
+
+@pytest.fixture(scope="class")
+def run_crew_mocks(class_mocker):
+    """Patch SocraticSofa once per class with a crew whose kickoff returns a result."""
+    mock_result = SimpleNamespace(raw="Test dialogue output")
+    mock_sofa, mock_crew_instance = _stub_crew(mock_result)
+
+    class_mocker.patch("socratic_sofa.main.SocraticSofa", mock_sofa)
+    return mock_sofa, mock_crew_instance, mock_result
+
 
 class TestRunFunction:
     """Test the run() CLI function."""
 
     @pytest.fixture
-    def mock_crew(self, mocker):
-        """Mock the SocraticSofa crew."""
-        mock_sofa = MagicMock()
-        mock_crew_instance = MagicMock()
-        mock_result = Mock()
-        mock_result.raw = "Test dialogue output"
-
-        mock_crew_instance.kickoff.return_value = mock_result
-        mock_sofa.return_value.crew.return_value = mock_crew_instance
-
-        mocker.patch("socratic_sofa.main.SocraticSofa", mock_sofa)
-        return mock_sofa, mock_crew_instance, mock_result
+    def mock_crew(self, run_crew_mocks):
+        """Reset the shared SocraticSofa mocks before each test."""
+        mock_sofa, mock_crew_instance, _ = run_crew_mocks
+        mock_sofa.reset_mock()
+        mock_crew_instance.kickoff.reset_mock(side_effect=True)
+        return run_crew_mocks
 
     def test_run_calls_kickoff(self, mock_crew):
         """run() should call crew.kickoff with inputs."""
-        from socratic_sofa.main import run
-
         mock_sofa, mock_crew_instance, _ = mock_crew
 
-        run()
+        main.run()
 
         mock_crew_instance.kickoff.assert_called_once()
 
     def test_run_passes_topic_input(self, mock_crew):
         """run() should pass topic in inputs."""
-        from socratic_sofa.main import run
-
         mock_sofa, mock_crew_instance, _ = mock_crew
 
-        run()
+        main.run()
 
-        call_args = mock_crew_instance.kickoff.call_args
-        assert "topic" in call_args[1]["inputs"]
-        assert call_args[1]["inputs"]["topic"] == "how to enjoy life?"
+        assert _inputs(mock_crew_instance.kickoff.call_args)["topic"] == "how to enjoy life?"
 
     def test_run_passes_current_year(self, mock_crew):
         """run() should pass current year in inputs."""
         from datetime import datetime
 
-        from socratic_sofa.main import run
-
         mock_sofa, mock_crew_instance, _ = mock_crew
 
-        run()
+        main.run()
 
-        call_args = mock_crew_instance.kickoff.call_args
-        assert "current_year" in call_args[1]["inputs"]
-        assert call_args[1]["inputs"]["current_year"] == str(datetime.now().year)
+        inputs = _inputs(mock_crew_instance.kickoff.call_args)
+        assert inputs["current_year"] == str(datetime.now().year)
 
     def test_run_raises_on_exception(self, mock_crew):
         """run() should raise exception with message on error."""
-        from socratic_sofa.main import run
-
         mock_sofa, mock_crew_instance, _ = mock_crew
         mock_crew_instance.kickoff.side_effect = Exception("API Error")
 
         with pytest.raises(Exception) as exc_info:
-            run()
+            main.run()
 
         assert "An error occurred while running the crew" in str(exc_info.value)
         assert "API Error" in str(exc_info.value)
@@ -83,10 +95,7 @@ class TestTrainFunction:
     @pytest.fixture
     def mock_crew_train(self, mocker):
         """Mock the SocraticSofa crew for training."""
-        mock_sofa = MagicMock()
-        mock_crew_instance = MagicMock()
-
-        mock_sofa.return_value.crew.return_value = mock_crew_instance
+        mock_sofa, mock_crew_instance = _stub_crew()
         mocker.patch("socratic_sofa.main.SocraticSofa", mock_sofa)
 
         return mock_sofa, mock_crew_instance
@@ -95,11 +104,9 @@ class TestTrainFunction:
         """train() should call crew.train with arguments."""
         mocker.patch.object(sys, "argv", ["main.py", "5", "output.json"])
 
-        from socratic_sofa.main import train
-
         mock_sofa, mock_crew_instance = mock_crew_train
 
-        train()
+        main.train()
 
         mock_crew_instance.train.assert_called_once()
 
@@ -107,11 +114,9 @@ class TestTrainFunction:
         """train() should pass n_iterations from argv."""
         mocker.patch.object(sys, "argv", ["main.py", "10", "output.json"])
 
-        from socratic_sofa.main import train
-
         mock_sofa, mock_crew_instance = mock_crew_train
 
-        train()
+        main.train()
 
         call_args = mock_crew_instance.train.call_args
         assert call_args[1]["n_iterations"] == 10
@@ -120,11 +125,9 @@ class TestTrainFunction:
         """train() should pass filename from argv."""
         mocker.patch.object(sys, "argv", ["main.py", "5", "training_output.json"])
 
-        from socratic_sofa.main import train
-
         mock_sofa, mock_crew_instance = mock_crew_train
 
-        train()
+        main.train()
 
         call_args = mock_crew_instance.train.call_args
         assert call_args[1]["filename"] == "training_output.json"
@@ -133,13 +136,11 @@ class TestTrainFunction:
         """train() should raise exception with message on error."""
         mocker.patch.object(sys, "argv", ["main.py", "5", "output.json"])
 
-        from socratic_sofa.main import train
-
         mock_sofa, mock_crew_instance = mock_crew_train
         mock_crew_instance.train.side_effect = Exception("Training Error")
 
         with pytest.raises(Exception) as exc_info:
-            train()
+            main.train()
 
         assert "An error occurred while training the crew" in str(exc_info.value)
 
@@ -150,10 +151,7 @@ class TestReplayFunction:
     @pytest.fixture
     def mock_crew_replay(self, mocker):
         """Mock the SocraticSofa crew for replay."""
-        mock_sofa = MagicMock()
-        mock_crew_instance = MagicMock()
-
-        mock_sofa.return_value.crew.return_value = mock_crew_instance
+        mock_sofa, mock_crew_instance = _stub_crew()
         mocker.patch("socratic_sofa.main.SocraticSofa", mock_sofa)
 
         return mock_sofa, mock_crew_instance
@@ -162,11 +160,9 @@ class TestReplayFunction:
         """replay() should call crew.replay with task_id."""
         mocker.patch.object(sys, "argv", ["main.py", "task-123"])
 
-        from socratic_sofa.main import replay
-
         mock_sofa, mock_crew_instance = mock_crew_replay
 
-        replay()
+        main.replay()
 
         mock_crew_instance.replay.assert_called_once_with(task_id="task-123")
 
@@ -174,13 +170,11 @@ class TestReplayFunction:
         """replay() should raise exception with message on error."""
         mocker.patch.object(sys, "argv", ["main.py", "task-123"])
 
-        from socratic_sofa.main import replay
-
         mock_sofa, mock_crew_instance = mock_crew_replay
         mock_crew_instance.replay.side_effect = Exception("Replay Error")
 
         with pytest.raises(Exception) as exc_info:
-            replay()
+            main.replay()
 
         assert "An error occurred while replaying the crew" in str(exc_info.value)
 
@@ -191,10 +185,7 @@ class TestTestFunction:
     @pytest.fixture
     def mock_crew_test(self, mocker):
         """Mock the SocraticSofa crew for testing."""
-        mock_sofa = MagicMock()
-        mock_crew_instance = MagicMock()
-
-        mock_sofa.return_value.crew.return_value = mock_crew_instance
+        mock_sofa, mock_crew_instance = _stub_crew()
         mocker.patch("socratic_sofa.main.SocraticSofa", mock_sofa)
 
         return mock_sofa, mock_crew_instance
@@ -203,11 +194,9 @@ class TestTestFunction:
         """test() should call crew.test with arguments."""
         mocker.patch.object(sys, "argv", ["main.py", "3", "gpt-4"])
 
-        from socratic_sofa.main import test
-
         mock_sofa, mock_crew_instance = mock_crew_test
 
-        test()
+        main.test()
 
         mock_crew_instance.test.assert_called_once()
 
@@ -215,11 +204,9 @@ class TestTestFunction:
         """test() should pass n_iterations from argv."""
         mocker.patch.object(sys, "argv", ["main.py", "5", "gpt-4"])
 
-        from socratic_sofa.main import test
-
         mock_sofa, mock_crew_instance = mock_crew_test
 
-        test()
+        main.test()
 
         call_args = mock_crew_instance.test.call_args
         assert call_args[1]["n_iterations"] == 5
@@ -228,11 +215,9 @@ class TestTestFunction:
         """test() should pass eval_llm from argv."""
         mocker.patch.object(sys, "argv", ["main.py", "3", "claude-3"])
 
-        from socratic_sofa.main import test
-
         mock_sofa, mock_crew_instance = mock_crew_test
 
-        test()
+        main.test()
 
         call_args = mock_crew_instance.test.call_args
         assert call_args[1]["eval_llm"] == "claude-3"
@@ -241,13 +226,11 @@ class TestTestFunction:
         """test() should raise exception with message on error."""
         mocker.patch.object(sys, "argv", ["main.py", "3", "gpt-4"])
 
-        from socratic_sofa.main import test
-
         mock_sofa, mock_crew_instance = mock_crew_test
         mock_crew_instance.test.side_effect = Exception("Test Error")
 
         with pytest.raises(Exception) as exc_info:
-            test()
+            main.test()
 
         assert "An error occurred while testing the crew" in str(exc_info.value)
 
@@ -258,39 +241,29 @@ class TestRunWithTriggerFunction:
     @pytest.fixture
     def mock_crew_trigger(self, mocker):
         """Mock the SocraticSofa crew for trigger runs."""
-        mock_sofa = MagicMock()
-        mock_crew_instance = MagicMock()
-        mock_result = Mock()
-        mock_result.raw = "Trigger output"
-
-        mock_crew_instance.kickoff.return_value = mock_result
-        mock_sofa.return_value.crew.return_value = mock_crew_instance
+        mock_result = SimpleNamespace(raw="Trigger output")
+        mock_sofa, mock_crew_instance = _stub_crew(mock_result)
 
         mocker.patch("socratic_sofa.main.SocraticSofa", mock_sofa)
         return mock_sofa, mock_crew_instance, mock_result
 
     def test_run_with_trigger_parses_json_payload(self, mock_crew_trigger, mocker):
         """run_with_trigger() should parse JSON payload from argv."""
-        payload = {"topic": "test topic", "extra": "data"}
-        mocker.patch.object(sys, "argv", ["main.py", json.dumps(payload)])
-
-        from socratic_sofa.main import run_with_trigger
+        mocker.patch.object(sys, "argv", ["main.py", _TRIGGER_PAYLOAD_JSON])
 
         mock_sofa, mock_crew_instance, _ = mock_crew_trigger
 
-        run_with_trigger()
+        main.run_with_trigger()
 
-        call_args = mock_crew_instance.kickoff.call_args
-        assert call_args[1]["inputs"]["crewai_trigger_payload"] == payload
+        inputs = _inputs(mock_crew_instance.kickoff.call_args)
+        assert inputs["crewai_trigger_payload"] == _TRIGGER_PAYLOAD
 
     def test_run_with_trigger_raises_on_missing_payload(self, mock_crew_trigger, mocker):
         """run_with_trigger() should raise when no payload provided."""
         mocker.patch.object(sys, "argv", ["main.py"])
 
-        from socratic_sofa.main import run_with_trigger
-
         with pytest.raises(Exception) as exc_info:
-            run_with_trigger()
+            main.run_with_trigger()
 
         assert "No trigger payload provided" in str(exc_info.value)
 
@@ -298,37 +271,29 @@ class TestRunWithTriggerFunction:
         """run_with_trigger() should raise on invalid JSON."""
         mocker.patch.object(sys, "argv", ["main.py", "not valid json"])
 
-        from socratic_sofa.main import run_with_trigger
-
         with pytest.raises(Exception) as exc_info:
-            run_with_trigger()
+            main.run_with_trigger()
 
         assert "Invalid JSON payload" in str(exc_info.value)
 
     def test_run_with_trigger_raises_on_crew_error(self, mock_crew_trigger, mocker):
         """run_with_trigger() should raise on crew execution error."""
-        payload = {"topic": "test"}
-        mocker.patch.object(sys, "argv", ["main.py", json.dumps(payload)])
-
-        from socratic_sofa.main import run_with_trigger
+        mocker.patch.object(sys, "argv", ["main.py", _TRIGGER_PAYLOAD_JSON])
 
         mock_sofa, mock_crew_instance, _ = mock_crew_trigger
         mock_crew_instance.kickoff.side_effect = Exception("Trigger Error")
 
         with pytest.raises(Exception) as exc_info:
-            run_with_trigger()
+            main.run_with_trigger()
 
         assert "An error occurred while running the crew with trigger" in str(exc_info.value)
 
     def test_run_with_trigger_returns_result(self, mock_crew_trigger, mocker):
         """run_with_trigger() should return the crew result."""
-        payload = {"topic": "test"}
-        mocker.patch.object(sys, "argv", ["main.py", json.dumps(payload)])
-
-        from socratic_sofa.main import run_with_trigger
+        mocker.patch.object(sys, "argv", ["main.py", _TRIGGER_PAYLOAD_JSON])
 
         mock_sofa, mock_crew_instance, mock_result = mock_crew_trigger
 
-        result = run_with_trigger()
+        result = main.run_with_trigger()
 
         assert result == mock_result
@@ -1,9 +1,10 @@
 """Tests for rate_limiter module using ratelimit library."""
 
-import time
+from functools import partial
+from types import SimpleNamespace
 
 import pytest
-from ratelimit import RateLimitException
+from ratelimit import RateLimitException, limits
 
 from socratic_sofa.rate_limiter import (
     DEFAULT_CALLS,
@@ -13,26 +14,47 @@ from socratic_sofa.rate_limiter import (
 )
 
 
-class TestRateLimited:
-    """Tests for the rate_limited decorator."""
+@pytest.fixture
+def virtual_clock(mocker):
+    """Drive the rate limiter from a fake clock that sleeping advances."""
+    clock = mocker.Mock(return_value=0.0)
+
+    def sleep(seconds):
+        clock.return_value += seconds
+
+    mocker.patch("socratic_sofa.rate_limiter.limits", partial(limits, clock=clock))
+    mocker.patch("ratelimit.decorators.time", SimpleNamespace(sleep=sleep))
+    return clock
+
+
+@pytest.fixture(params=[rate_limited, rate_limited_no_retry])
+def limiter(request):
+    """Each rate limiting decorator, for behaviour both must share."""
+    return request.param
 
-    def test_allows_calls_under_limit(self):
-        """Calls under the limit should succeed."""
+
+class TestBothDecorators:
+    """Behaviour shared by rate_limited and rate_limited_no_retry."""
+
+    def test_allows_calls_up_to_limit(self, limiter):
+        """Calls under and at the limit should both succeed."""
         call_count = 0
 
-        @rate_limited(calls=5, period=60)
+        @limiter(calls=2, period=60)
         def test_func():
             nonlocal call_count
             call_count += 1
             return "success"
 
-        for _ in range(5):
-            result = test_func()
-            assert result == "success"
+        assert test_func() == "success"
+        assert test_func() == "success"
+        assert call_count == 2
+
 
-        assert call_count == 5
+class TestRateLimited:
+    """Tests for the rate_limited decorator."""
 
-    def test_sleeps_and_retries_when_over_limit(self):
+    def test_sleeps_and_retries_when_over_limit(self, virtual_clock):
         """Should sleep and retry when rate limit exceeded."""
         call_count = 0
 
@@ -43,12 +65,12 @@ class TestRateLimited:
             return call_count
 
         # First two calls should be immediate
-        start = time.monotonic()
+        start = virtual_clock()
         test_func()
         test_func()
         # Third call should wait ~1 second
         test_func()
-        elapsed = time.monotonic() - start
+        elapsed = virtual_clock() - start
 
         assert call_count == 3
         # Should have waited approximately 1 second
@@ -89,22 +111,6 @@ class TestRateLimited:
 class TestRateLimitedNoRetry:
     """Tests for the rate_limited_no_retry decorator."""
 
-    def test_allows_calls_under_limit(self):
-        """Calls under the limit should succeed."""
-        call_count = 0
-
-        @rate_limited_no_retry(calls=3, period=60)
-        def test_func():
-            nonlocal call_count
-            call_count += 1
-            return "success"
-
-        for _ in range(3):
-            result = test_func()
-            assert result == "success"
-
-        assert call_count == 3
-
     def test_raises_exception_when_over_limit(self):
         """Should raise RateLimitException when limit exceeded."""
 
@@ -131,7 +137,7 @@ class TestRateLimitedNoRetry:
         assert another_function.__name__ == "another_function"
         assert another_function.__doc__ == "Another docstring."
 
-    def test_allows_after_period_expires(self):
+    def test_allows_after_period_expires(self, virtual_clock):
         """Should allow calls after the period expires."""
 
         @rate_limited_no_retry(calls=2, period=1)
@@ -147,7 +153,7 @@ class TestRateLimitedNoRetry:
             test_func()
 
         # Wait for period to expire
-        time.sleep(1.1)
+        virtual_clock.return_value += 1.1
 
         # Should work again
         result = test_func()
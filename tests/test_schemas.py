@@ -1,5 +1,7 @@
 """Tests for Pydantic output schemas."""
 
+import re
+
 import pytest
 from pydantic import ValidationError
 
@@ -16,6 +18,103 @@ from socratic_sofa.schemas import (
 )
 
 
+def _any_of(expected: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a pattern matching any of the expected substrings in one scan."""
+    return re.compile("|".join(map(re.escape, expected)))
+
+
+_TOPIC_EXPECTED = (
+    "## What is justice?",
+    "Justice is a core concept",
+    "**Key Concepts:**",
+    "- fairness",
+    "- virtue",
+    "- law",
+)
+_TOPIC_RE = _any_of(_TOPIC_EXPECTED)
+
+_INQUIRY_EXPECTED = (
+    "## 🔵 First Line of Inquiry",
+    "**Philosophical Angle:** Individual moral experience",
+    "Let us examine justice personally.",
+    "### Question 1",
+    "> What do you mean by justice?",
+    "*Purpose: To clarify the definition*",
+    "**Insight:** Personal and social justice may conflict.",
+)
+_INQUIRY_RE = _any_of(_INQUIRY_EXPECTED)
+
+_JUDGMENT_EXPECTED = (
+    "## Dialectic Evaluation",
+    "### Scoring Breakdown",
+    "| **Question Quality** (40%)",
+    "4/5",
+    "**Winner**: Second",
+    "+7%",
+    "### Recommendation",
+    "Explore practical implications more.",
+)
+_JUDGMENT_RE = _any_of(_JUDGMENT_EXPECTED)
+
+# Shared criterion scores; models are never mutated, so one instance can fill many slots
+_SCORE_2 = CriterionScore.model_construct(score=2, assessment="Weak")
+_SCORE_3 = CriterionScore.model_construct(score=3, assessment="Adequate")
+_SCORE_4 = CriterionScore.model_construct(score=4, assessment="Good")
+_SCORE_5 = CriterionScore.model_construct(score=5, assessment="Excellent")
+
+# Pre-built questions for tests that only care about how many there are
+_QUESTION_POOL = [
+    SocraticQuestion.model_construct(question=f"Q{i}?", purpose=f"P{i}") for i in range(8)
+]
+
+
+@pytest.fixture(scope="module")
+def sample_evaluation():
+    """Create a sample InquiryEvaluation for testing (trusted data, so skip validation)."""
+    return InquiryEvaluation.model_construct(
+        question_quality=_SCORE_4,
+        elenctic_effectiveness=_SCORE_3,
+        philosophical_insight=_SCORE_4,
+        socratic_fidelity=_SCORE_4,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_questions():
+    """Five SocraticQuestions covering the usual clarify/probe/contradict moves."""
+    return [
+        SocraticQuestion.model_construct(question=q, purpose=p)
+        for q, p in [
+            ("What do you mean by justice?", "To clarify the definition"),
+            ("Is justice the same as fairness?", "To probe assumptions"),
+            ("Can there be unjust laws?", "To reveal contradictions"),
+            ("Who determines what is just?", "To examine authority"),
+            ("Is justice universal or relative?", "To explore scope"),
+        ]
+    ]
+
+
+@pytest.fixture(scope="module")
+def formatted_judgment(sample_evaluation):
+    """Format one judgment, whose second inquiry mixes high, mid and low scores."""
+    mixed_evaluation = InquiryEvaluation.model_construct(
+        question_quality=_SCORE_5,
+        elenctic_effectiveness=_SCORE_3,
+        philosophical_insight=_SCORE_2,
+        socratic_fidelity=_SCORE_3,
+    )
+    output = JudgmentOutput.model_construct(
+        first_inquiry=sample_evaluation,
+        second_inquiry=mixed_evaluation,
+        differentiation_score=7,
+        differentiation_assessment="Second takes a different angle effectively.",
+        winner="Second",
+        socratic_exemplification="Second better demonstrates elenchus.",
+        recommendation="Explore practical implications more.",
+    )
+    return format_judgment_output(output)
+
+
 class TestTopicOutput:
     """Tests for TopicOutput schema."""
 
@@ -30,40 +129,30 @@ class TestTopicOutput:
         assert "fundamental" in output.context
         assert len(output.key_concepts) == 3
 
-    def test_topic_output_minimum_concepts(self):
-        """Test TopicOutput with minimum 2 key concepts."""
+    @pytest.mark.parametrize(
+        "key_concepts",
+        [["knowledge", "belief"], ["pleasure", "virtue", "meaning", "flourishing"]],
+        ids=["minimum", "maximum"],
+    )
+    def test_topic_output_concept_count_boundaries(self, key_concepts):
+        """Test TopicOutput accepts the minimum 2 and maximum 4 key concepts."""
         output = TopicOutput(
             topic="What is truth?",
             context="Truth is central to epistemology.",
-            key_concepts=["knowledge", "belief"],
+            key_concepts=key_concepts,
         )
-        assert len(output.key_concepts) == 2
-
-    def test_topic_output_maximum_concepts(self):
-        """Test TopicOutput with maximum 4 key concepts."""
-        output = TopicOutput(
-            topic="What is happiness?",
-            context="Happiness is a core concern in ethics.",
-            key_concepts=["pleasure", "virtue", "meaning", "flourishing"],
-        )
-        assert len(output.key_concepts) == 4
-
-    def test_topic_output_too_few_concepts(self):
-        """Test TopicOutput fails with fewer than 2 key concepts."""
-        with pytest.raises(ValidationError):
+        assert len(output.key_concepts) == len(key_concepts)
+
+    @pytest.mark.parametrize(
+        "key_concepts",
+        [["emotion"], ["being", "becoming", "essence", "existence", "reality"]],
+        ids=["too_few", "too_many"],
+    )
+    def test_topic_output_concept_count_out_of_range(self, key_concepts):
+        """Test TopicOutput fails with fewer than 2 or more than 4 key concepts."""
+        with pytest.raises(ValidationError, match="key_concepts"):
             TopicOutput(
-                topic="What is love?",
-                context="Love is complex.",
-                key_concepts=["emotion"],  # Only 1
-            )
-
-    def test_topic_output_too_many_concepts(self):
-        """Test TopicOutput fails with more than 4 key concepts."""
-        with pytest.raises(ValidationError):
-            TopicOutput(
-                topic="What is existence?",
-                context="Existence is fundamental.",
-                key_concepts=["being", "becoming", "essence", "existence", "reality"],  # 5
+                topic="What is love?", context="Love is complex.", key_concepts=key_concepts
             )
 
 
@@ -85,9 +174,7 @@ class TestInquiryOutput:
 
     def test_valid_inquiry_output(self):
         """Test creating a valid InquiryOutput."""
-        questions = [
-            SocraticQuestion(question=f"Question {i}?", purpose=f"Purpose {i}") for i in range(5)
-        ]
+        questions = _QUESTION_POOL[:5]
         output = InquiryOutput(
             philosophical_angle="Individual moral experience",
             opening_statement="Let us examine justice from the individual's perspective.",
@@ -99,7 +186,7 @@ class TestInquiryOutput:
 
     def test_inquiry_output_minimum_questions(self):
         """Test InquiryOutput with minimum 5 questions."""
-        questions = [SocraticQuestion(question=f"Q{i}?", purpose=f"P{i}") for i in range(5)]
+        questions = _QUESTION_POOL[:5]
         output = InquiryOutput(
             philosophical_angle="Test angle",
             opening_statement="Test statement",
@@ -110,7 +197,7 @@ class TestInquiryOutput:
 
     def test_inquiry_output_maximum_questions(self):
         """Test InquiryOutput with maximum 7 questions."""
-        questions = [SocraticQuestion(question=f"Q{i}?", purpose=f"P{i}") for i in range(7)]
+        questions = _QUESTION_POOL[:7]
         output = InquiryOutput(
             philosophical_angle="Test angle",
             opening_statement="Test statement",
@@ -119,21 +206,11 @@ class TestInquiryOutput:
         )
         assert len(output.questions) == 7
 
-    def test_inquiry_output_too_few_questions(self):
-        """Test InquiryOutput fails with fewer than 5 questions."""
-        questions = [SocraticQuestion(question=f"Q{i}?", purpose=f"P{i}") for i in range(4)]
-        with pytest.raises(ValidationError):
-            InquiryOutput(
-                philosophical_angle="Test",
-                opening_statement="Test",
-                questions=questions,
-                insight_summary="Test",
-            )
-
-    def test_inquiry_output_too_many_questions(self):
-        """Test InquiryOutput fails with more than 7 questions."""
-        questions = [SocraticQuestion(question=f"Q{i}?", purpose=f"P{i}") for i in range(8)]
-        with pytest.raises(ValidationError):
+    @pytest.mark.parametrize("count", [4, 8], ids=["too_few", "too_many"])
+    def test_inquiry_output_question_count_out_of_range(self, count):
+        """Test InquiryOutput fails with fewer than 5 or more than 7 questions."""
+        questions = _QUESTION_POOL[:count]
+        with pytest.raises(ValidationError, match="questions"):
             InquiryOutput(
                 philosophical_angle="Test",
                 opening_statement="Test",
@@ -161,15 +238,11 @@ class TestCriterionScore:
         score = CriterionScore(score=5, assessment="Outstanding")
         assert score.score == 5
 
-    def test_score_too_low(self):
-        """Test score fails when below 1."""
-        with pytest.raises(ValidationError):
-            CriterionScore(score=0, assessment="Invalid")
-
-    def test_score_too_high(self):
-        """Test score fails when above 5."""
-        with pytest.raises(ValidationError):
-            CriterionScore(score=6, assessment="Invalid")
+    @pytest.mark.parametrize("score", [0, 6, -1, 100])
+    def test_score_out_of_range(self, score):
+        """Test score fails outside the 1-5 range."""
+        with pytest.raises(ValidationError, match="score"):
+            CriterionScore(score=score, assessment="Invalid")
 
 
 class TestInquiryEvaluation:
@@ -178,10 +251,10 @@ class TestInquiryEvaluation:
     def test_valid_evaluation(self):
         """Test creating a valid InquiryEvaluation."""
         evaluation = InquiryEvaluation(
-            question_quality=CriterionScore(score=4, assessment="Good probing"),
-            elenctic_effectiveness=CriterionScore(score=3, assessment="Some contradictions"),
-            philosophical_insight=CriterionScore(score=5, assessment="Deep insights"),
-            socratic_fidelity=CriterionScore(score=4, assessment="Follows method"),
+            question_quality=_SCORE_4,
+            elenctic_effectiveness=_SCORE_3,
+            philosophical_insight=_SCORE_5,
+            socratic_fidelity=_SCORE_4,
         )
         assert evaluation.question_quality.score == 4
         assert evaluation.philosophical_insight.score == 5
@@ -190,16 +263,6 @@ class TestInquiryEvaluation:
 class TestJudgmentOutput:
     """Tests for JudgmentOutput schema."""
 
-    @pytest.fixture
-    def sample_evaluation(self):
-        """Create a sample InquiryEvaluation for testing."""
-        return InquiryEvaluation(
-            question_quality=CriterionScore(score=4, assessment="Good"),
-            elenctic_effectiveness=CriterionScore(score=3, assessment="Adequate"),
-            philosophical_insight=CriterionScore(score=4, assessment="Insightful"),
-            socratic_fidelity=CriterionScore(score=4, assessment="Authentic"),
-        )
-
     def test_valid_judgment_output(self, sample_evaluation):
         """Test creating a valid JudgmentOutput."""
         output = JudgmentOutput(
@@ -240,26 +303,14 @@ class TestJudgmentOutput:
         )
         assert output.differentiation_score == 10
 
-    def test_differentiation_score_too_low(self, sample_evaluation):
-        """Test differentiation score fails below 0."""
-        with pytest.raises(ValidationError):
+    @pytest.mark.parametrize("score", [-1, 11])
+    def test_differentiation_score_out_of_range(self, sample_evaluation, score):
+        """Test differentiation score fails outside the 0-10 range."""
+        with pytest.raises(ValidationError, match="differentiation_score"):
             JudgmentOutput(
                 first_inquiry=sample_evaluation,
                 second_inquiry=sample_evaluation,
-                differentiation_score=-1,
-                differentiation_assessment="Invalid",
-                winner="First",
-                socratic_exemplification="Test",
-                recommendation="Test",
-            )
-
-    def test_differentiation_score_too_high(self, sample_evaluation):
-        """Test differentiation score fails above 10."""
-        with pytest.raises(ValidationError):
-            JudgmentOutput(
-                first_inquiry=sample_evaluation,
-                second_inquiry=sample_evaluation,
-                differentiation_score=11,
+                differentiation_score=score,
                 differentiation_assessment="Invalid",
                 winner="First",
                 socratic_exemplification="Test",
@@ -272,131 +323,41 @@ class TestFormatTopicOutput:
 
     def test_format_topic_output(self):
         """Test formatting TopicOutput to markdown."""
-        output = TopicOutput(
+        output = TopicOutput.model_construct(
             topic="What is justice?",
             context="Justice is a core concept in moral philosophy.",
             key_concepts=["fairness", "virtue", "law"],
         )
         result = format_topic_output(output)
 
-        assert "## What is justice?" in result
-        assert "Justice is a core concept" in result
-        assert "**Key Concepts:**" in result
-        assert "- fairness" in result
-        assert "- virtue" in result
-        assert "- law" in result
+        assert set(_TOPIC_RE.findall(result)) >= set(_TOPIC_EXPECTED)
 
 
 class TestFormatInquiryOutput:
     """Tests for format_inquiry_output function."""
 
-    def test_format_inquiry_output(self):
+    def test_format_inquiry_output(self, sample_questions):
         """Test formatting InquiryOutput to markdown."""
-        questions = [
-            SocraticQuestion(
-                question="What do you mean by justice?",
-                purpose="To clarify the definition",
-            ),
-            SocraticQuestion(
-                question="Is justice the same as fairness?",
-                purpose="To probe assumptions",
-            ),
-            SocraticQuestion(
-                question="Can there be unjust laws?",
-                purpose="To reveal contradictions",
-            ),
-            SocraticQuestion(
-                question="Who determines what is just?",
-                purpose="To examine authority",
-            ),
-            SocraticQuestion(
-                question="Is justice universal or relative?",
-                purpose="To explore scope",
-            ),
-        ]
-        output = InquiryOutput(
+        output = InquiryOutput.model_construct(
             philosophical_angle="Individual moral experience",
             opening_statement="Let us examine justice personally.",
-            questions=questions,
+            questions=sample_questions,
             insight_summary="Personal and social justice may conflict.",
         )
 
         result = format_inquiry_output(output, "First Line of Inquiry", "🔵")
 
-        assert "## 🔵 First Line of Inquiry" in result
-        assert "**Philosophical Angle:** Individual moral experience" in result
-        assert "Let us examine justice personally." in result
-        assert "### Question 1" in result
-        assert "> What do you mean by justice?" in result
-        assert "*Purpose: To clarify the definition*" in result
-        assert "**Insight:** Personal and social justice may conflict." in result
+        assert set(_INQUIRY_RE.findall(result)) >= set(_INQUIRY_EXPECTED)
 
 
 class TestFormatJudgmentOutput:
     """Tests for format_judgment_output function."""
 
-    def test_format_judgment_output(self):
+    def test_format_judgment_output(self, formatted_judgment):
         """Test formatting JudgmentOutput to markdown."""
-        evaluation = InquiryEvaluation(
-            question_quality=CriterionScore(score=4, assessment="Strong probing"),
-            elenctic_effectiveness=CriterionScore(score=3, assessment="Good contradictions"),
-            philosophical_insight=CriterionScore(score=5, assessment="Deep insights"),
-            socratic_fidelity=CriterionScore(score=4, assessment="Authentic method"),
-        )
-
-        output = JudgmentOutput(
-            first_inquiry=evaluation,
-            second_inquiry=evaluation,
-            differentiation_score=7,
-            differentiation_assessment="Second takes a different angle effectively.",
-            winner="Second",
-            socratic_exemplification="Second better demonstrates elenchus.",
-            recommendation="Explore practical implications more.",
-        )
-
-        result = format_judgment_output(output)
-
-        assert "## Dialectic Evaluation" in result
-        assert "### Scoring Breakdown" in result
-        assert "| **Question Quality** (40%)" in result
-        assert "4/5" in result
-        assert "**Winner**: Second" in result
-        assert "+7%" in result
-        assert "### Recommendation" in result
-        assert "Explore practical implications more." in result
-
-    def test_format_judgment_uses_correct_emojis(self):
-        """Test that formatting uses correct emojis based on scores."""
-        high_score = CriterionScore(score=5, assessment="Excellent")
-        mid_score = CriterionScore(score=3, assessment="Adequate")
-        low_score = CriterionScore(score=2, assessment="Weak")
-
-        evaluation_high = InquiryEvaluation(
-            question_quality=high_score,
-            elenctic_effectiveness=high_score,
-            philosophical_insight=high_score,
-            socratic_fidelity=high_score,
-        )
-        evaluation_mixed = InquiryEvaluation(
-            question_quality=high_score,
-            elenctic_effectiveness=mid_score,
-            philosophical_insight=low_score,
-            socratic_fidelity=mid_score,
-        )
-
-        output = JudgmentOutput(
-            first_inquiry=evaluation_high,
-            second_inquiry=evaluation_mixed,
-            differentiation_score=5,
-            differentiation_assessment="Partial differentiation",
-            winner="First",
-            socratic_exemplification="First is stronger overall",
-            recommendation="Second needs more depth",
-        )
-
-        result = format_judgment_output(output)
+        assert set(_JUDGMENT_RE.findall(formatted_judgment)) >= set(_JUDGMENT_EXPECTED)
 
-        # Check emojis appear (✅ for high, ⚠️ for mid, ❌ for low)
-        assert "✅" in result
-        assert "⚠️" in result
-        assert "❌" in result
+    @pytest.mark.parametrize("emoji", ["✅", "⚠️", "❌"], ids=["high", "mid", "low"])
+    def test_format_judgment_uses_correct_emojis(self, formatted_judgment, emoji):
+        """Test that formatting uses the emoji for each score level."""
+        assert emoji in formatted_judgment